@@ -0,0 +1,10 @@
+"""
+Benchmarks for the solvers and the solve loop.
+
+Run them with `python -m benchmarks`, see `python -m benchmarks --help`.
+
+The corpora in `corpus` hold 100 puzzles each, made with :mod:`sudoku.generate`
+from seed 6 and sorted by the hardest technique :mod:`sudoku.grade` needs:
+`easy` up to singles, `medium` naked pairs to pointing pairs, `hard` box line
+reduction to single chains and `extreme` puzzles that need a search.
+"""
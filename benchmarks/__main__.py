@@ -0,0 +1,170 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+from sudoku.engine import solve
+from sudoku.field import Field
+from sudoku.solver import all_solvers
+
+ROOT = Path(__file__).parent
+SAVEGAMES = ROOT.parent / "tests" / "savegames"
+CORPORA = ROOT / "corpus"
+RESULTS = ROOT / "results"
+
+
+def measure(func: Callable[[], Any], min_time: float, min_rounds: int = 3) -> dict:
+    """
+    calls `func` until it ran for at least `min_time` seconds and `min_rounds` times.
+
+    The peak and retained memory of one call are measured in a separate call, so
+    tracing does not slow down the timed rounds.
+    """
+    rounds: list[float] = []
+    total = 0.0
+    while total < min_time or len(rounds) < min_rounds:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        rounds.append(elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return dict(
+        rounds=len(rounds),
+        best=min(rounds),
+        mean=total / len(rounds),
+        ops_per_sec=len(rounds) / total,
+        peak_bytes=peak,
+        retained_bytes=retained,
+    )
+
+
+def solver_benchmarks() -> Iterator[tuple[str, Callable[[], Any], int]]:
+    """
+    runs every solver of `all_solvers` on every savegame, without applying the actions.
+    """
+    for savegame in sorted(SAVEGAMES.glob("*.savegame")):
+        field = Field("")
+        field.load(savegame)
+        for solver in all_solvers:
+
+            def run(solver=solver, field=field) -> None:
+                for _ in solver(field):
+                    pass
+
+            yield f"solver/{solver.__name__}/{savegame.stem}", run, 1
+
+
+def solve_benchmarks() -> Iterator[tuple[str, Callable[[], Any], int]]:
+    """
+    runs the whole solve loop on every puzzle of a corpus.
+    """
+    for corpus in sorted(CORPORA.glob("*.txt")):
+        puzzles = corpus.read_text().split()
+
+        def run(puzzles=puzzles) -> None:
+            for puzzle in puzzles:
+                solve(Field(puzzle))
+
+        yield f"solve/{corpus.stem}", run, len(puzzles)
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=ROOT,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict]) -> None:
+    print(f"{'benchmark':<50} {'ops/sec':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        ops = result["ops_per_sec"]
+        if name in baseline:
+            base = baseline[name]["ops_per_sec"]
+            print(f"{name:<50} {ops:>12.1f} {base:>12.1f} {ops / base - 1:>+8.1%}")
+        else:
+            print(f"{name:<50} {ops:>12.1f} {'-':>12} {'':>8}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum time in seconds per benchmark (default: 0.2)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON file for the results (default: benchmarks/results/<commit>.json)",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="JSON file of an earlier run to compare the results with",
+    )
+    args = parser.parse_args(argv)
+
+    commit = current_commit()
+    results = {}
+    for name, run, puzzles in chain(solver_benchmarks(), solve_benchmarks()):
+        if args.filter not in name:
+            continue
+        result = measure(run, args.min_time)
+        result["puzzles_per_sec"] = result["ops_per_sec"] * puzzles
+        results[name] = result
+
+    output = args.output or RESULTS / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            dict(
+                commit=commit,
+                python=sys.version,
+                platform=platform.platform(),
+                timestamp=time.time(),
+                benchmarks=results,
+            ),
+            indent=2,
+        )
+    )
+
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["benchmarks"]
+    compare(results, baseline)
+    print(f"results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,24 +1,47 @@
-# from .field import Field
+import argparse
 
+from . import batch, canonical, generate
 
-# field = Field(
-#     # "123456789789123456456789123512647938934815267867932514248371695395264871671598342"
-#     "800000503501007000700308210680073000009005000300004805970500680063789000150040007"
-# )
-# actions = field.show_possibles()
-# field.apply(actions)
-# field.set_cell(1, 0, 9)
-# actions = field.show_possibles()
-# for action in actions:
-#     print(action)
-# # print(repr(field.get_cell(1, 0)))
-# # field.set_cell(1, 0, 9)
 
-# # print(field)
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sudoku")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("gui", help="start the pygame GUI (default)")
+    batch.add_arguments(
+        commands.add_parser("batch", help="solve many puzzles from a file or stdin")
+    )
+    generate_parser = commands.add_parser("generate", help="generate random puzzles")
+    generate.add_arguments(generate_parser)
+    canonical.add_arguments(
+        commands.add_parser(
+            "dedup", help="remove puzzles that are the same up to symmetry"
+        )
+    )
+    args = parser.parse_args(argv)
 
+    if args.command == "batch":
+        return batch.run(args)
+    if args.command == "generate":
+        try:
+            generate.check_options(
+                min_clues=args.min_clues,
+                max_clues=args.max_clues,
+                easiest=args.easiest,
+                hardest=args.hardest,
+            )
+        except ValueError as error:
+            generate_parser.error(str(error))
+        return generate.run(args)
+    if args.command == "dedup":
+        return canonical.run(args)
 
-from .pg_gui.game import main
+    from .pg_gui.game import main as gui_main
 
-# from .text_ui.game import main
+    # from .text_ui.game import main as gui_main
 
-main()
+    gui_main()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
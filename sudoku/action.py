@@ -1,6 +1,7 @@
 from typing import Literal, NamedTuple, TypeAlias
 
 from .cell import Cell
+from .reason import Reason
 
 action_str: TypeAlias = Literal["remove_possible", "set_number"]
 
@@ -15,11 +16,13 @@ class Action(NamedTuple):
 
     `cell` is the cell, where this action could be applied
 
-    `reason` is a string that will be appended to the `_debug` list to cell if `action` is "remove_possible"
+    `reason` explains the action, a :class:`sudoku.reason.Reason` or a string. It will
+    be appended to the `_debug` list to cell if `action` is "remove_possible".
+    Solvers leave it `None` for fields that don't record reasons.
 
     """
 
     action: action_str
     value: int
     cell: Cell
-    reason: str
+    reason: str | Reason | None
@@ -0,0 +1,259 @@
+"""
+Solve many puzzles at once, spread over multiple processes.
+
+Puzzles are read one per line, as 81 characters in the format accepted by
+:class:`sudoku.field.Field`, `.` may be used for empty cells. For each puzzle
+one line with the (partial) solution, the status and the time in seconds is
+written, tab separated and in input order.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from itertools import islice
+from typing import NamedTuple, TextIO, TypeVar
+
+from .engine import solve
+from .field import Field
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchResult(NamedTuple):
+    """
+    `solution` contains the values of all 81 cells, `0` for cells that were not solved.
+
+    `status` is the lower case name of the :class:`sudoku.engine.SolveStatus`, or
+    `invalid` when the puzzle could not be read.
+    """
+
+    solution: str
+    status: str
+    seconds: float
+
+    def __str__(self) -> str:
+        return f"{self.solution}\t{self.status}\t{self.seconds:.6f}"
+
+
+def _normalize(puzzle: str) -> str:
+    return puzzle.strip().replace(".", "0")
+
+
+def _is_valid(puzzle: str) -> bool:
+    return len(puzzle) == 81 and puzzle.isdigit()
+
+
+def solve_puzzle(
+    puzzle: str, fallback: bool = False, field: Field | None = None
+) -> BatchResult:
+    """
+    solves a single puzzle line, see :func:`sudoku.engine.solve` for `fallback`.
+
+    When `field` is given, it is reset to the puzzle and reused.
+    """
+    start = time.perf_counter()
+    puzzle = _normalize(puzzle)
+    if not _is_valid(puzzle):
+        return BatchResult(puzzle, "invalid", time.perf_counter() - start)
+    if field is None:
+        field = Field.from_string(puzzle, record_reasons=False)
+    else:
+        field.reset(puzzle)
+    result = solve(field, fallback=fallback)
+    solution = "".join(map(str, field.grid.values))
+    return BatchResult(
+        solution, result.status.name.lower(), time.perf_counter() - start
+    )
+
+
+def solve_chunk(
+    puzzles: list[str], fallback: bool = False, vectorized: bool = False
+) -> list[BatchResult]:
+    """
+    solves a chunk of puzzle lines.
+
+    With `vectorized` the chunk is solved at once by :mod:`sudoku.vectorized`, the
+    time of each puzzle is then its share of the time of the whole chunk.
+    """
+    if not vectorized:
+        field = Field("", record_reasons=False)
+        return [solve_puzzle(puzzle, fallback, field) for puzzle in puzzles]
+
+    from .vectorized import solve as solve_vectorized
+
+    start = time.perf_counter()
+    puzzles = [_normalize(puzzle) for puzzle in puzzles]
+    solutions = iter(
+        solve_vectorized([puzzle for puzzle in puzzles if _is_valid(puzzle)], fallback)
+    )
+    seconds = (time.perf_counter() - start) / len(puzzles)
+    results = []
+    for puzzle in puzzles:
+        if not _is_valid(puzzle):
+            results.append(BatchResult(puzzle, "invalid", seconds))
+        else:
+            solution = next(solutions)
+            results.append(
+                BatchResult(solution.solution, solution.status.name.lower(), seconds)
+            )
+    return results
+
+
+def _chunks(items: Iterable[T], chunksize: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def map_chunks(
+    function: Callable[[list[T]], list[R]],
+    items: Iterable[T],
+    workers: int | None = None,
+    chunksize: int = 64,
+) -> Iterator[R]:
+    """
+    calls `function` with chunks of `items` and yields the results in input order.
+
+    The chunks of `chunksize` items are sent to a pool of `workers` processes.
+    Only a few chunks per worker are in flight at any time, so `items` can be an
+    endless stream. With a single worker everything runs in this process.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be positive, not {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, not {chunksize}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return _map_chunks(function, items, workers, chunksize)
+
+
+def _map_chunks(
+    function: Callable[[list[T]], list[R]],
+    items: Iterable[T],
+    workers: int,
+    chunksize: int,
+) -> Iterator[R]:
+    if workers == 1:
+        for chunk in _chunks(items, chunksize):
+            yield from function(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[R]]] = deque()
+        for chunk in _chunks(items, chunksize):
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def solve_many(
+    puzzles: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = 64,
+    fallback: bool = False,
+    vectorized: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    solves all puzzles and yields the results in input order.
+
+    The puzzles are sent in chunks to a pool of processes, see :func:`map_chunks`.
+
+    With `fallback` puzzles the solvers get stuck on are finished by an exact cover
+    search.
+
+    With `vectorized` each chunk is solved at once with NumPy, which pays off for
+    larger chunks, see :func:`solve_chunk`.
+    """
+    return map_chunks(
+        partial(solve_chunk, fallback=fallback, vectorized=vectorized),
+        puzzles,
+        workers,
+        chunksize,
+    )
+
+
+def _puzzle_lines(source: TextIO) -> Iterator[str]:
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def positive_int(text: str) -> int:
+    """
+    returns the positive integer `text`, for the `type` of an argument.
+    """
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be positive, not {value}")
+    return value
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="file with one puzzle per line, `-` reads from stdin (default)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to write the results to, `-` writes to stdout (default)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=positive_int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=positive_int,
+        default=64,
+        help="number of puzzles sent to a worker at once (default: 64)",
+    )
+    parser.add_argument(
+        "--fallback",
+        action="store_true",
+        help="finish puzzles the logical solvers get stuck on with an exact cover search",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="solve each chunk at once with NumPy, use it with a larger --chunksize",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    with ExitStack() as stack:
+        source = (
+            sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        )
+        target = (
+            sys.stdout
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "w"))
+        )
+        for result in solve_many(
+            _puzzle_lines(source),
+            workers=args.workers,
+            chunksize=args.chunksize,
+            fallback=args.fallback,
+            vectorized=args.vectorized,
+        ):
+            print(result, file=target)
+    return 0
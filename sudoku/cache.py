@@ -0,0 +1,259 @@
+"""
+Cache the results of solving and grading puzzles.
+
+The results are kept in an in-process LRU of bounded size and, when a path is
+given, in an SQLite database that survives restarts and can be shared between
+processes. A hit doesn't create a :class:`sudoku.field.Field` at all.
+
+Every result is stamped with :func:`solver_version`, a hash of the sources of the
+solvers and the engine, so results of older solvers are never returned.
+
+With `canonical` the puzzles are looked up by their canonical form, see
+:mod:`sudoku.canonical`, so all equivalent puzzles share one entry. Computing the
+canonical form costs about as much as solving an easy puzzle, so it pays off for
+hard puzzles and many equivalent duplicates. The solution is mapped back to the
+puzzle, but `hardest`, `steps` and `score` are the grade of the canonical form.
+The solvers visit the units in a fixed order, so the steps of an equivalent
+puzzle can differ slightly.
+
+Writes to the database are committed in batches of :data:`COMMIT_INTERVAL` and on
+:meth:`ResultCache.close`. Results of other solver versions stay in the database,
+so checkouts of different versions can share it, :meth:`ResultCache.prune` removes
+them.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Self
+
+from .canonical import canonicalize
+from .engine import SolveStatus, fill
+from .field import Field
+from .grade import grade
+
+COMMIT_INTERVAL = 256
+"""number of new results that are written to the database in one transaction"""
+
+_SOURCES = (
+    "cache.py",
+    "engine.py",
+    "grade.py",
+    "field.py",
+    "grid.py",
+    "cell.py",
+    "candidates.py",
+    "units.py",
+    "chain.py",
+    "reason.py",
+    "canonical.py",
+)
+
+
+class CachedResult(NamedTuple):
+    """
+    `solution` contains the values of all 81 cells, `0` for cells that were not solved.
+
+    `status` is the lower case name of the :class:`sudoku.engine.SolveStatus` of the
+    grade. When the techniques get stuck, the solution is finished by
+    :func:`sudoku.engine.fill` and the status stays `stuck`. Puzzles without a
+    solution are cached as `contradiction`.
+
+    `hardest`, `steps` and `score` are the grade, see :class:`sudoku.grade.Grade`.
+    """
+
+    solution: str
+    status: str
+    hardest: str | None
+    steps: dict[str, int]
+    score: int
+
+
+@functools.cache
+def solver_version() -> str:
+    """
+    returns a hash of the sources of the solvers and all modules they depend on,
+    including the canonical form that is used as key.
+    """
+    package = Path(__file__).parent
+    sources = sorted((package / "solver").glob("*.py"))
+    sources += [package / name for name in _SOURCES]
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def normalize(puzzle: str) -> str:
+    """
+    returns the 81 values of the puzzle as string, `.` may be used for empty cells.
+    """
+    values = "".join(value for value in puzzle.replace(".", "0") if "0" <= value <= "9")
+    if len(values) > 81:
+        raise ValueError(f"a field has 81 cells, but got {len(values)} values")
+    return values.ljust(81, "0")
+
+
+def compute(puzzle: str) -> CachedResult:
+    """
+    solves and grades the puzzle, without any cache.
+    """
+    field = Field.from_string(puzzle, record_reasons=False)
+    result = grade(field)
+    status = result.status
+    if status == SolveStatus.STUCK and fill(field) is None:
+        status = SolveStatus.CONTRADICTION
+    return CachedResult(
+        "".join(map(str, field.grid.values)),
+        status.name.lower(),
+        result.hardest,
+        result.steps,
+        result.score,
+    )
+
+
+class ResultCache:
+    """
+    A cache in front of :func:`compute`.
+
+    `maxsize` is the number of results kept in memory. With `path` the results
+    are also stored in an SQLite database at this path.
+    """
+
+    __slots__ = [
+        "_db",
+        "_memory",
+        "_unsaved",
+        "_version",
+        "canonical",
+        "hits",
+        "maxsize",
+        "misses",
+    ]
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        path: Path | str | None = None,
+        canonical: bool = False,
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.canonical: bool = canonical
+        self.hits: int = 0
+        self.misses: int = 0
+        self._memory: OrderedDict[str, CachedResult] = OrderedDict()
+        self._version: str = solver_version()
+        self._db: sqlite3.Connection | None = None
+        self._unsaved: int = 0
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "puzzle TEXT, version TEXT, solution TEXT, status TEXT, "
+                "hardest TEXT, steps TEXT, score INTEGER, PRIMARY KEY (puzzle, version))"
+            )
+            self._db.commit()
+
+    def prune(self) -> int:
+        """
+        removes the results of other solver versions from the database and returns
+        their number.
+        """
+        if self._db is None:
+            return 0
+        cursor = self._db.execute(
+            "DELETE FROM results WHERE version != ?", (self._version,)
+        )
+        self._db.commit()
+        return cursor.rowcount
+
+    def get(self, puzzle: str) -> CachedResult:
+        """
+        returns the result of the puzzle, from the cache when possible.
+        """
+        puzzle = normalize(puzzle)
+        if not self.canonical:
+            return self._get(puzzle)
+        canonical = canonicalize(puzzle)
+        result = self._get(canonical.puzzle)
+        inverse = canonical.transform.invert()
+        return result._replace(solution=inverse.apply(result.solution))
+
+    def _get(self, puzzle: str) -> CachedResult:
+        result = self._memory.get(puzzle)
+        if result is not None:
+            self._memory.move_to_end(puzzle)
+            self.hits += 1
+            return result
+        result = self._load(puzzle)
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            result = compute(puzzle)
+            self._store(puzzle, result)
+        self._memory[puzzle] = result
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        return result
+
+    def _load(self, puzzle: str) -> CachedResult | None:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT solution, status, hardest, steps, score FROM results "
+            "WHERE puzzle = ? AND version = ?",
+            (puzzle, self._version),
+        ).fetchone()
+        if row is None:
+            return None
+        solution, status, hardest, steps, score = row
+        return CachedResult(solution, status, hardest, json.loads(steps), score)
+
+    def _store(self, puzzle: str, result: CachedResult) -> None:
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                puzzle,
+                self._version,
+                result.solution,
+                result.status,
+                result.hardest,
+                json.dumps(result.steps),
+                result.score,
+            ),
+        )
+        self._unsaved += 1
+        if self._unsaved >= COMMIT_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        commits the results that are not yet written to the database.
+        """
+        if self._db is not None and self._unsaved:
+            self._db.commit()
+        self._unsaved = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
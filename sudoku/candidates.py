@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, MutableSet
+from typing import Any, TypeAlias
+
+from .types import CellValue
+
+CandidateMask: TypeAlias = (
+    int  # bit `n - 1` is set when the number `n` is still possible
+)
+
+ALL_CANDIDATES: CandidateMask = 0b111111111
+NO_CANDIDATES: CandidateMask = 0
+
+BIT: tuple[CandidateMask, ...] = (0,) + tuple(1 << (n - 1) for n in range(1, 10))
+"""
+`BIT[n]` is the mask with only the number `n` set, `BIT[0]` is the empty mask.
+"""
+
+DIGITS: tuple[tuple[CellValue, ...], ...] = tuple(
+    tuple(n for n in range(1, 10) if mask & BIT[n]) for mask in range(512)
+)
+"""
+`DIGITS[mask]` is the sorted tuple of all numbers in the mask.
+"""
+
+POPCOUNT: tuple[int, ...] = tuple(len(digits) for digits in DIGITS)
+"""
+`POPCOUNT[mask]` is the number of possible numbers in the mask.
+"""
+
+
+def mask_of(values: Iterable[CellValue]) -> CandidateMask:
+    """
+    returns the mask with all numbers of `values` set.
+    """
+    mask = 0
+    for value in values:
+        mask |= BIT[value]
+    return mask
+
+
+class Candidates(MutableSet[CellValue]):
+    """
+    A set-compatible view on the candidate mask of a cell.
+
+    It exists for backwards compatibility with code that treats `Cell.hopeful`
+    as a `set[int]`. Reading from it or changing it reads and writes the mask
+    of the cell directly. Set operations like `-`, `|` and `&` return plain sets.
+    """
+
+    __slots__ = ["_attribute", "_owner"]
+
+    def __init__(self, owner: Any, attribute: str = "candidates") -> None:
+        self._owner = owner
+        self._attribute = attribute
+
+    @property
+    def mask(self) -> CandidateMask:
+        return getattr(self._owner, self._attribute)
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[CellValue]) -> set[CellValue]:
+        return set(it)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or not 1 <= value <= 9:
+            return False
+        return bool(self.mask & BIT[value])
+
+    def __iter__(self) -> Iterator[CellValue]:
+        return iter(DIGITS[self.mask])
+
+    def __len__(self) -> int:
+        return POPCOUNT[self.mask]
+
+    def add(self, value: CellValue) -> None:
+        setattr(self._owner, self._attribute, self.mask | BIT[value])
+
+    def discard(self, value: CellValue) -> None:
+        setattr(self._owner, self._attribute, self.mask & ~BIT[value])
+
+    def __repr__(self) -> str:
+        if not self.mask:
+            return "set()"
+        return "{" + ", ".join(map(str, DIGITS[self.mask])) + "}"
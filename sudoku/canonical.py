@@ -0,0 +1,381 @@
+"""
+Find a canonical form of a puzzle, to detect puzzles that are the same up to the
+symmetries of sudoku.
+
+Relabeling the numbers, swapping rows inside a band, swapping bands, swapping
+columns inside a stack, swapping stacks and transposing the field don't change
+a puzzle in any way that matters. All puzzles that can be turned into each other
+this way have the same canonical form.
+
+The canonical form is the transformed puzzle with the smallest key. The key reads
+the transformed puzzle column by column, first as pattern of the clues and then
+with the numbers relabeled in the order of their first appearance. Only the row
+arrangements have to be enumerated, the best column arrangement for the clue
+pattern follows by sorting and only ties are searched for the numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from itertools import permutations, product
+from typing import NamedTuple
+
+from .batch import map_chunks, positive_int
+from .field import Field
+from .types import CellPosition, CellValue
+
+_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(permutations(range(3)))
+
+
+class Transform(NamedTuple):
+    """
+    A symmetry of sudoku, that maps a puzzle to an equivalent puzzle.
+
+    The cell at `row` and `column` of the transformed puzzle has the value
+    `digits[value]`, where `value` is the value of the cell at `rows[row]` and
+    `columns[column]` of the original puzzle, after it was transposed when
+    `transpose` is set.
+    """
+
+    transpose: bool
+    rows: tuple[int, ...]
+    columns: tuple[int, ...]
+    digits: tuple[CellValue, ...]
+
+    @classmethod
+    def identity(cls) -> Transform:
+        return cls(False, tuple(range(9)), tuple(range(9)), tuple(range(10)))
+
+    def apply(self, puzzle: str) -> str:
+        """
+        returns the transformed puzzle.
+        """
+        values = _values(puzzle)
+        result = []
+        for row in range(9):
+            for column in range(9):
+                source = CellPosition(self.columns[column], self.rows[row])
+                if self.transpose:
+                    source = CellPosition(source.y, source.x)
+                result.append(self.digits[values[source.as_int()]])
+        return "".join(map(str, result))
+
+    def invert(self) -> Transform:
+        """
+        returns the transform that maps the transformed puzzle back.
+        """
+        rows = _inverse(self.rows)
+        columns = _inverse(self.columns)
+        digits = _inverse(self.digits)
+        if self.transpose:
+            return Transform(True, columns, rows, digits)
+        return Transform(False, rows, columns, digits)
+
+
+class Canonical(NamedTuple):
+    """
+    `puzzle` is the canonical form and `transform` maps the original puzzle to it.
+    """
+
+    puzzle: str
+    transform: Transform
+
+
+def _inverse(permutation: tuple[int, ...]) -> tuple[int, ...]:
+    inverse = [0] * len(permutation)
+    for index, value in enumerate(permutation):
+        inverse[value] = index
+    return tuple(inverse)
+
+
+def _values(puzzle: str | Field) -> list[CellValue]:
+    """
+    returns the 81 values of the puzzle, parsed like
+    :meth:`sudoku.field.Field.from_string` does.
+    """
+    if isinstance(puzzle, Field):
+        return list(puzzle.grid.values)
+    return list(Field._parse(puzzle.strip()))
+
+
+def _row_arrangements() -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+    """
+    yields the 1296 arrangements of the rows, that keep the rows of a band together,
+    as the order of the bands and the index of the order of the rows in each band.
+    """
+    for bands in _PERMUTATIONS:
+        for orders in product(range(6), repeat=3):
+            yield bands, orders
+
+
+_ROW_ARRANGEMENTS = tuple(_row_arrangements())
+
+
+class _Search:
+    """
+    The search for the canonical form of one puzzle.
+    """
+
+    __slots__ = ["best", "best_transform", "grids"]
+
+    def __init__(self, values: list[CellValue]) -> None:
+        transposed = [values[x * 9 + y] for y in range(9) for x in range(9)]
+        # grids[transpose][row][column]
+        self.grids = tuple(
+            tuple(tuple(grid[row * 9 : row * 9 + 9]) for row in range(9))
+            for grid in (values, transposed)
+        )
+        self.best: list[int] | None = None
+        self.best_transform = Transform.identity()
+
+    def _band_patterns(self, transpose: bool) -> list[list[tuple[int, ...]]]:
+        """
+        returns for each band and each order of its rows, the clue pattern of the
+        columns of the band as 3 bit numbers.
+        """
+        grid = self.grids[transpose]
+        return [
+            [
+                tuple(
+                    sum(
+                        (grid[3 * band + row][column] != 0) << (2 - bit)
+                        for bit, row in enumerate(order)
+                    )
+                    for column in range(9)
+                )
+                for order in _PERMUTATIONS
+            ]
+            for band in range(3)
+        ]
+
+    def run(self) -> Transform:
+        ties = []
+        best_pattern = None
+        for transpose in (False, True):
+            patterns = self._band_patterns(transpose)
+            for bands, orders in _ROW_ARRANGEMENTS:
+                columns = [
+                    top << 6 | middle << 3 | bottom
+                    for top, middle, bottom in zip(
+                        patterns[bands[0]][orders[0]],
+                        patterns[bands[1]][orders[1]],
+                        patterns[bands[2]][orders[2]],
+                    )
+                ]
+                stacks = sorted(
+                    (sorted(columns[0:3]), sorted(columns[3:6]), sorted(columns[6:9]))
+                )
+                if best_pattern is None or stacks < best_pattern:
+                    best_pattern = stacks
+                    ties = [(transpose, bands, orders, columns)]
+                elif stacks == best_pattern:
+                    ties.append((transpose, bands, orders, columns))
+        assert best_pattern is not None
+        target = [pattern for stack in best_pattern for pattern in stack]
+        searched = set()
+        for transpose, bands, orders, columns in ties:
+            rows = tuple(
+                3 * band + row
+                for band, order in zip(bands, orders)
+                for row in _PERMUTATIONS[order]
+            )
+            grid = self.grids[transpose]
+            # arrangements that give the same rows have the same column arrangements
+            arranged = tuple(grid[row] for row in rows)
+            if arranged in searched:
+                continue
+            searched.add(arranged)
+            cells = [tuple(row[column] for row in arranged) for column in range(9)]
+            self._columns(transpose, rows, columns, cells, target)
+        return self.best_transform
+
+    def _columns(
+        self,
+        transpose: bool,
+        rows: tuple[int, ...],
+        patterns: list[int],
+        cells: list[tuple[int, ...]],
+        target: list[int],
+    ) -> None:
+        """
+        searches the column arrangements with the best clue pattern for the one
+        with the smallest relabeled numbers.
+        """
+        digits = [0] * 10
+        stack_cells = [cells[3 * stack : 3 * stack + 3] for stack in range(3)]
+        chosen: list[int] = []
+        key: list[int] = []
+        used_stacks: list[int] = []
+
+        def search(position: int) -> None:
+            if position == 9:
+                if self.best is None or key < self.best:
+                    self.best = list(key)
+                    self.best_transform = Transform(
+                        transpose, rows, tuple(chosen), tuple(digits)
+                    )
+                return
+            if position % 3 == 0:
+                stacks = [s for s in range(3) if s not in used_stacks]
+            else:
+                stacks = [used_stacks[-1]]
+            # columns with the same numbers in the same kind of stack lead to the
+            # same keys, so only the first of them is searched
+            tried = set()
+            for stack in stacks:
+                if position % 3 == 0:
+                    contents = tuple(sorted(stack_cells[stack]))
+                else:
+                    contents = ()
+                for column in range(3 * stack, 3 * stack + 3):
+                    if column in chosen or patterns[column] != target[position]:
+                        continue
+                    branch = (cells[column], contents)
+                    if branch in tried:
+                        continue
+                    tried.add(branch)
+                    labels = []
+                    next_label = max(digits) + 1
+                    for value in cells[column]:
+                        if value and not digits[value]:
+                            digits[value] = next_label
+                            labels.append(value)
+                            next_label += 1
+                    key.extend(digits[value] for value in cells[column])
+                    # no arrangement with a larger prefix can be the smallest
+                    if self.best is None or key <= self.best[: len(key)]:
+                        chosen.append(column)
+                        if position % 3 == 0:
+                            used_stacks.append(stack)
+                        search(position + 1)
+                        if position % 3 == 0:
+                            used_stacks.pop()
+                        chosen.pop()
+                    del key[-9:]
+                    for value in labels:
+                        digits[value] = 0
+
+        search(0)
+
+
+def canonicalize(puzzle: str | Field) -> Canonical:
+    """
+    returns the canonical form of the puzzle and the transform that maps the puzzle
+    to it.
+
+    Puzzles are given as 81 characters `0` to `9` or `.` for empty cells, like for
+    :meth:`sudoku.field.Field.from_string`.
+    """
+    values = _values(puzzle)
+    transform = _Search(values).run()
+    digits = list(transform.digits)
+    # numbers that don't appear in the puzzle get the remaining labels
+    unused = iter(label for label in range(1, 10) if label not in digits)
+    for value in range(1, 10):
+        if not digits[value]:
+            digits[value] = next(unused)
+    transform = transform._replace(digits=tuple(digits))
+    return Canonical(transform.apply("".join(map(str, values))), transform)
+
+
+def canonical_key(puzzle: str | Field) -> str:
+    """
+    returns the canonical form of the puzzle.
+    """
+    return canonicalize(puzzle).puzzle
+
+
+def _canonical_keys(puzzles: list[str]) -> list[str]:
+    return [canonical_key(puzzle) for puzzle in puzzles]
+
+
+def dedup(
+    puzzles: Iterable[str], workers: int | None = None, chunksize: int = 64
+) -> Iterator[tuple[str, str]]:
+    """
+    yields the first puzzle of each canonical form with its canonical form.
+
+    The canonical forms are computed in parallel, see :func:`sudoku.batch.map_chunks`.
+    Only the canonical forms that were seen are kept in memory.
+    """
+    seen: set[str] = set()
+    buffered: deque[str] = deque()
+
+    def remember(items: Iterable[str]) -> Iterator[str]:
+        for item in items:
+            buffered.append(item)
+            yield item
+
+    for key in map_chunks(_canonical_keys, remember(puzzles), workers, chunksize):
+        puzzle = buffered.popleft()
+        if key not in seen:
+            seen.add(key)
+            yield puzzle, key
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="file with one puzzle per line, `-` reads from stdin (default)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to write the puzzles to, `-` writes to stdout (default)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=positive_int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=positive_int,
+        default=64,
+        help="number of puzzles sent to a worker at once (default: 64)",
+    )
+    parser.add_argument(
+        "--canonical",
+        action="store_true",
+        help="write the canonical form instead of the first puzzle of each form",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    with ExitStack() as stack:
+        source = (
+            sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        )
+        target = (
+            sys.stdout
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "w"))
+        )
+        invalid = 0
+
+        def puzzles() -> Iterator[str]:
+            nonlocal invalid
+            for number, line in enumerate(source, 1):
+                puzzle = line.strip()
+                if not puzzle or puzzle.startswith("#"):
+                    continue
+                try:
+                    _values(puzzle)
+                except ValueError as error:
+                    print(f"line {number}: {error}", file=sys.stderr)
+                    invalid += 1
+                    continue
+                yield puzzle
+
+        for puzzle, key in dedup(puzzles(), args.workers, args.chunksize):
+            print(key if args.canonical else puzzle, file=target)
+    return 1 if invalid else 0
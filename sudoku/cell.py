@@ -1,32 +1,99 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from .candidates import ALL_CANDIDATES, BIT, DIGITS, CandidateMask, Candidates, mask_of
+from .grid import Grid
 from .types import CellPosition, CellValue
+from .units import POSITIONS
 
 
 class Cell:
     """
-    The Cell stores the value of a cell, its position, possible values and contains
-    list of reasons why a number is not possible anymore.
+    The Cell is a view on the value, possible values and the list of reasons why a
+    number is not possible anymore, of a single cell of a :class:`sudoku.grid.Grid`.
 
     It is not aware of any other Cell.
 
-    `hopeful` is a set of all possible values that this cell could have in the future.
+    A Cell created on its own gets a grid for just this cell, the cells of a
+    :class:`sudoku.field.Field` are views on the grid of the field.
+
+    `candidates` is a 9 bit mask of all possible values that this cell could have in the future.
+
+    `hopeful` is a set-compatible view on `candidates`.
 
     `_debug` is a list of strings that explain why certain numbers are not possible anymore.
     """
 
-    __slots__ = ["_value", "_position", "hopeful", "futile", "_debug"]
+    __slots__ = ["_grid", "_index", "_position"]
 
     def __init__(self, value: CellValue, position: CellPosition):
+        self._grid: Grid = Grid((value,))
+        self._index: int = 0
         self._position: CellPosition = position
-        self.hopeful: set[CellValue] = (
-            {1, 2, 3, 4, 5, 6, 7, 8, 9} if value == 0 else set()
-        )  # numbers that are still possible
-        self.futile: set[CellValue] = set()  # numbers that are not possible anymore
-        self._debug: list[tuple[CellValue, str]] = (
-            list()
-        )  # list of reason why a number is not possible anymore
-        self._value = value
+
+    @classmethod
+    def view(cls, grid: Grid, index: int) -> Cell:
+        """
+        returns a Cell that reads and writes the cell `index` of `grid`.
+        """
+        cell = cls.__new__(cls)
+        cell._grid = grid
+        cell._index = index
+        cell._position = POSITIONS[index]
+        return cell
+
+    @property
+    def index(self) -> int:
+        """
+        the index of the cell in its grid.
+        """
+        return self._index
+
+    @property
+    def candidates(self) -> CandidateMask:
+        """
+        the mask of all numbers that are still possible.
+        """
+        return self._grid.candidates[self._index]
+
+    @candidates.setter
+    def candidates(self, mask: CandidateMask) -> None:
+        self._grid.candidates[self._index] = mask
+        self._grid.touch(self._index)
+
+    @property
+    def hopeful(self) -> Candidates:
+        """
+        a set-compatible view of all numbers that are still possible.
+
+        Prefer `candidates` in performance critical code.
+        """
+        return Candidates(self, "candidates")
+
+    @hopeful.setter
+    def hopeful(self, values: Iterable[CellValue]) -> None:
+        self.candidates = mask_of(values)
+
+    @property
+    def futile(self) -> frozenset[CellValue]:
+        """
+        all numbers that are not possible anymore for a cell without value.
+        """
+        if self._value:
+            return frozenset()
+        return frozenset(DIGITS[ALL_CANDIDATES & ~self.candidates])
+
+    @property
+    def _debug(self) -> list[tuple[CellValue, str]]:
+        """
+        list of reasons why a number is not possible anymore.
+        """
+        return [
+            (value, str(reason))
+            for index, value, reason in self._grid.log
+            if index == self._index
+        ]
 
     @property
     def position(self) -> CellPosition:
@@ -40,6 +107,15 @@ class Cell:
         """
         return self._position
 
+    @property
+    def _value(self) -> CellValue:
+        return self._grid.values[self._index]
+
+    @_value.setter
+    def _value(self, value: CellValue) -> None:
+        self._grid.values[self._index] = value
+        self._grid.touch(self._index)
+
     @property
     def value(self) -> CellValue:
         """
@@ -49,22 +125,24 @@ class Cell:
 
         When the cell value will be set:
 
-        It will raise an AssertionError when the value is not in self.hopeful
-        It will raise an AssertionError when the value is in self.futile
+        It will raise an AssertionError when the value is not in self.candidates
 
         It cannot be set to 0 after a value has been asigned. You need to use
         the private property `_value` the change it.
 
-        After the value has been asigned, the hopeful set will be cleared.
+        After the value has been asigned, the candidates will be cleared.
         """
-        return self._value
+        return self._grid.values[self._index]
 
     @value.setter
     def value(self, value: CellValue) -> None:
-        assert value in self.hopeful, f"Cell {self.position} can't be set to {value}"
-        assert value not in self.futile, f"Cell {self.position} can't be set to {value}"
-        self._value = value
-        self.hopeful = set()
+        grid = self._grid
+        assert grid.candidates[self._index] & BIT[value], (
+            f"Cell {self.position} can't be set to {value}"
+        )
+        grid.values[self._index] = value
+        grid.candidates[self._index] = 0
+        grid.touch(self._index)
 
     def sees(self, other: Cell) -> bool:
         return (
@@ -77,7 +155,7 @@ class Cell:
         return f"{self._value}"
 
     def __repr__(self) -> str:
-        return f"Cell(position={self.position}, value={self._value!r}, hopeful={self.hopeful}, futile={self.futile}, )"
+        return f"Cell(position={self.position}, value={self._value!r}, hopeful={self.hopeful}, futile={set(self.futile)}, )"
 
     def __lt__(self, other: Cell) -> bool:
         return self.position.as_int() < other.position.as_int()
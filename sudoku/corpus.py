@@ -0,0 +1,173 @@
+"""
+Random access to very large puzzle files without reading them.
+
+A corpus is either a text file with one puzzle per line, 81 characters in the
+format accepted by :class:`sudoku.field.Field` with `.` or `0` for empty cells, or
+a container of :mod:`sudoku.savegame`. The file is memory mapped, so only the
+pages that are accessed are read, and processes that open the same file share
+the pages.
+
+Text files get a sidecar index with the offset of every puzzle, next to the file
+with the suffix `.idx`. It is built on first use and rebuilt when the file
+changed. Containers have fixed size boards and need no index.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from itertools import pairwise
+from pathlib import Path
+from typing import Self, overload
+
+from . import savegame
+from .field import Field
+from .grid import Grid
+
+INDEX_MAGIC = b"SDKI"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sBxxxQQ")
+"""magic, version, size and modification time in nanoseconds of the corpus file"""
+
+PUZZLE_SIZE = 81
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+def build_index(buffer: mmap.mmap | bytes) -> array[int]:
+    """
+    returns the offsets of all puzzle lines, empty lines and lines starting with `#`
+    are skipped.
+    """
+    offsets = array("Q")
+    start = 0
+    end = len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        if stop < 0:
+            stop = end
+        line = buffer[start : start + 1]
+        if line not in (b"", b"\n", b"\r", b"#") and stop - start >= PUZZLE_SIZE:
+            offsets.append(start)
+        start = stop + 1
+    return offsets
+
+
+class Corpus:
+    """
+    A memory mapped puzzle file.
+
+    `corpus[index]` returns a :class:`sudoku.field.Field`, `corpus[start:stop]` a
+    list of fields and :meth:`raw` the bytes of a puzzle without creating a field.
+
+    A corpus can be pickled to send it to worker processes, each process maps
+    the file again and can take its own range of indices, see :meth:`ranges`.
+    """
+
+    __slots__ = ["_binary", "_buffer", "_offsets", "path"]
+
+    def __init__(self, path: Path | str) -> None:
+        self.path: Path = Path(path)
+        self._buffer: mmap.mmap | bytes = b""
+        # the mapping stays valid after the file is closed
+        with self.path.open("rb") as file:
+            # empty files can't be mapped
+            if self.path.stat().st_size:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._binary: bool = self._buffer[:4] == savegame.CONTAINER_MAGIC
+        self._offsets: array[int] | None = None if self._binary else self._index()
+
+    def _index(self) -> array[int]:
+        """
+        returns the offsets of the puzzles from the sidecar index, and builds it
+        when it is missing or outdated.
+        """
+        stat = self.path.stat()
+        expected = INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns
+        )
+        sidecar = index_path(self.path)
+        try:
+            content = sidecar.read_bytes()
+        except OSError:
+            content = b""
+        offsets = array("Q")
+        if content[: INDEX_HEADER.size] == expected:
+            offsets.frombytes(content[INDEX_HEADER.size :])
+            return offsets
+        offsets = build_index(self._buffer)
+        try:
+            sidecar.write_bytes(expected + offsets.tobytes())
+        except OSError:
+            # a read only location only costs rebuilding the index next time
+            pass
+        return offsets
+
+    def __len__(self) -> int:
+        if self._offsets is None:
+            return savegame.container_size(self._buffer)
+        return len(self._offsets)
+
+    def raw(self, index: int) -> bytes:
+        """
+        returns the puzzle `index` as it is stored in the file, the 81 characters of
+        a line or a board of a container.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("corpus index out of range")
+        if self._offsets is None:
+            offset = savegame.CONTAINER_HEADER_SIZE + index * savegame.BOARD.size
+            return self._buffer[offset : offset + savegame.BOARD.size]
+        offset = self._offsets[index]
+        return self._buffer[offset : offset + PUZZLE_SIZE]
+
+    def grid(self, index: int) -> Grid:
+        """
+        returns the grid of the puzzle `index`.
+        """
+        raw = self.raw(index)
+        if self._offsets is None:
+            board = savegame.BOARD.unpack(raw)
+            return Grid(board[:81], board[81:])
+        return Field.from_string(raw).grid
+
+    @overload
+    def __getitem__(self, index: int) -> Field: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Field]: ...
+
+    def __getitem__(self, index: int | slice) -> Field | list[Field]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return Field.from_grid(self.grid(index))
+
+    def ranges(self, parts: int) -> list[range]:
+        """
+        returns `parts` ranges of indices of about the same size, that cover the
+        whole corpus.
+        """
+        size = len(self)
+        bounds = [size * part // parts for part in range(parts + 1)]
+        return [range(start, stop) for start, stop in pairwise(bounds)]
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> Path:
+        return self.path
+
+    def __setstate__(self, path: Path) -> None:
+        self.__init__(path)  # type: ignore[misc]
@@ -0,0 +1,252 @@
+"""
+A headless solve driver for a :class:`sudoku.field.Field`.
+
+It runs the solvers of :data:`sudoku.solver.weighted_solvers` until the field is
+solved, no solver can change the field anymore, or a contradiction is found.
+It does not print anything and does not depend on the GUI.
+"""
+
+from __future__ import annotations
+
+import enum
+from collections.abc import Callable, Iterable
+from random import Random
+from typing import Any, NamedTuple
+
+from .action import Action
+from .candidates import ALL_CANDIDATES, BIT
+from .field import Field
+from .reason import Reason, Technique
+from .solver import SolverStats, exact_cover, weighted_solvers
+from .units import UNITS
+
+Solver = Callable[..., Iterable[Action]]
+
+
+class SolveStatus(enum.Enum):
+    SOLVED = enum.auto()
+    STUCK = enum.auto()
+    CONTRADICTION = enum.auto()
+
+
+class SolveResult(NamedTuple):
+    """
+    `status` tells if the field was solved, if the solvers got stuck or if the field
+    contains a contradiction.
+
+    `steps` is the number of solver runs that changed the field.
+
+    `changes` is the number of actions that changed the field.
+
+    `stats` are the statistics per solver and unit type, when they were requested.
+
+    `fallback` is `True` when the logical solvers got stuck and the remaining cells
+    were filled in by :mod:`sudoku.solver.exact_cover`.
+    """
+
+    status: SolveStatus
+    steps: int
+    changes: int
+    stats: SolverStats | None = None
+    fallback: bool = False
+
+
+class Step(NamedTuple):
+    """
+    `solver` is the name of the solver that changed the field.
+
+    `actions` are the actions of that solver that changed the field.
+    """
+
+    solver: str
+    actions: list[Action]
+
+
+class Contradiction(Exception):
+    """
+    Raised when an action cannot be applied, because the field contains a contradiction.
+    """
+
+
+def is_solved(field: Field) -> bool:
+    """
+    returns `True` when all cells have a value and there is no contradiction.
+    """
+    return 0 not in field.grid.values and not is_contradiction(field)
+
+
+def is_contradiction(field: Field) -> bool:
+    """
+    returns `True` when the field can't be solved anymore, because
+     - a cell without value has no possible numbers left
+     - a number is set twice in the same unit
+     - a number is neither set nor possible in a unit
+    """
+    values = field.grid.values
+    candidates = field.grid.candidates
+    for unit in UNITS:
+        placed = 0
+        possible = 0
+        for index in unit:
+            value = values[index]
+            if value:
+                if placed & BIT[value]:
+                    return True
+                placed |= BIT[value]
+            elif not candidates[index]:
+                return True
+            else:
+                possible |= candidates[index]
+        if placed | possible != ALL_CANDIDATES:
+            return True
+    return False
+
+
+def _sorted_solvers(
+    solvers: Iterable[tuple[int, Solver]] | None,
+) -> list[Solver]:
+    if solvers is None:
+        solvers = weighted_solvers
+    return [solver for _, solver in sorted(solvers, key=lambda entry: entry[0])]
+
+
+def _apply(
+    field: Field,
+    solver: Solver,
+    stats: SolverStats | None,
+    since: dict[Solver, int] | None,
+    rng: Random | None = None,
+) -> list[Action]:
+    kwargs: dict[str, Any] = {}
+    if stats is not None:
+        kwargs["stats"] = stats
+    if rng is not None:
+        kwargs["rng"] = rng
+    if since is not None:
+        if solver in since:
+            kwargs["since"] = since[solver]
+        since[solver] = field.grid.generation
+    actions = list(solver(field, **kwargs))
+    flags: list[bool] = []
+    try:
+        try:
+            flags = field.apply_many(actions).changed
+        except AssertionError as e:
+            raise Contradiction(str(e)) from e
+    finally:
+        if stats is not None:
+            stats.record_changed(flags)
+    changed = [action for action, has_changed in zip(actions, flags) if has_changed]
+    return changed
+
+
+def step(
+    field: Field,
+    solvers: Iterable[tuple[int, Solver]] | None = None,
+    stats: SolverStats | None = None,
+    since: dict[Solver, int] | None = None,
+    rng: Random | None = None,
+) -> Step | None:
+    """
+    runs the solvers from the lowest to the highest weight and stops after the first
+    solver that changed the field.
+
+    returns `None` when no solver could change the field.
+
+    It will raise a :class:`Contradiction` when an action could not be applied.
+
+    When `stats` is given, the solvers are instrumented and record into it.
+
+    `since` maps each solver to the generation of the grid when it ran last time.
+    Solvers only revisit the units that changed since then, and `since` is updated.
+    Leave it out to let every solver look at every unit.
+
+    The solvers visit the units in a fixed order, so a step is reproducible. With
+    `rng`, a :class:`random.Random`, they visit them in a random order instead.
+    """
+    for solver in _sorted_solvers(solvers):
+        if changed := _apply(field, solver, stats, since, rng):
+            return Step(getattr(solver, "__name__", repr(solver)), changed)
+    return None
+
+
+def solve(
+    field: Field,
+    solvers: Iterable[tuple[int, Solver]] | None = None,
+    stats: SolverStats | None = None,
+    fallback: bool = False,
+    on_step: Callable[[Step], None] | None = None,
+    rng: Random | None = None,
+) -> SolveResult:
+    """
+    applies :func:`step` until the field is solved, stuck or contains a contradiction.
+
+    After each step it starts again with the solver of the lowest weight, so the
+    cheapest technique is always preferred. Each solver only revisits the units
+    that changed since it ran the last time.
+
+    When `stats` is given, the solvers are instrumented and the statistics are
+    returned with the result. Without it the solvers run without any overhead.
+
+    With `fallback` a stuck field is finished by :func:`fill`, so every valid puzzle
+    ends up solved and the logical steps are still counted for grading.
+
+    `on_step` is called with every :class:`Step` that changed the field, see
+    :func:`sudoku.grade.grade`.
+
+    Without `rng` every solve of the same puzzle takes the same steps. Pass a seeded
+    :class:`random.Random` to explore other solve paths reproducibly.
+    """
+    ordered = list(solvers) if solvers is not None else weighted_solvers
+    since: dict[Solver, int] = {}
+    steps = 0
+    changes = 0
+    while True:
+        if is_contradiction(field):
+            return SolveResult(SolveStatus.CONTRADICTION, steps, changes, stats)
+        if 0 not in field.grid.values:
+            return SolveResult(SolveStatus.SOLVED, steps, changes, stats)
+        try:
+            result = step(field, ordered, stats, since, rng)
+        except Contradiction:
+            return SolveResult(SolveStatus.CONTRADICTION, steps, changes, stats)
+        if result is None:
+            if fallback:
+                return _fill(field, steps, changes, stats)
+            return SolveResult(SolveStatus.STUCK, steps, changes, stats)
+        if on_step is not None:
+            on_step(result)
+        steps += 1
+        changes += len(result.actions)
+
+
+_EXACT_COVER = Reason(Technique.EXACT_COVER)
+
+
+def fill(field: Field) -> int | None:
+    """
+    sets all remaining cells to the first solution found by
+    :func:`sudoku.solver.exact_cover.solve`.
+
+    returns the number of cells that were set, or `None` when the field has no
+    solution with its current candidates. The field is unchanged in that case.
+    """
+    solution = exact_cover.solve(field)
+    if solution is None:
+        return None
+    values = field.grid.values
+    filled = 0
+    for index, value in enumerate(solution):
+        if not values[index]:
+            field.place(index, value, _EXACT_COVER)
+            filled += 1
+    return filled
+
+
+def _fill(
+    field: Field, steps: int, changes: int, stats: SolverStats | None
+) -> SolveResult:
+    filled = fill(field)
+    if filled is None:
+        return SolveResult(SolveStatus.CONTRADICTION, steps, changes, stats, True)
+    return SolveResult(SolveStatus.SOLVED, steps, changes + filled, stats, True)
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
+from sudoku import savegame
 from sudoku.action import Action
+from sudoku.candidates import (
+    ALL_CANDIDATES,
+    BIT,
+    DIGITS,
+    POPCOUNT,
+    CandidateMask,
+    mask_of,
+)
 from sudoku.cell import Cell
-from sudoku.types import CellPosition, CellValue
+from sudoku.grid import Grid, Snapshot
+from sudoku.reason import Reason, Technique
+from sudoku.types import CellValue
+from sudoku.units import CELL_UNITS, PEERS, POSITIONS, UNITS, unit_id
+
+if TYPE_CHECKING:
+    from sudoku.engine import SolveResult
+    from sudoku.journal import Journal
+
+_DIGITS = b"0123456789"
+_NOT_DIGITS = bytes(byte for byte in range(256) if byte not in _DIGITS)
+_TO_VALUES = bytes.maketrans(_DIGITS + b".", bytes(range(10)) + b"\0")
+
+
+class ApplySummary(NamedTuple):
+    """
+    The result of :meth:`Field.apply_many`.
+
+    `changed` tells for each action, in the given order, if it changed the field.
+    Duplicates of an earlier action never change the field.
+
+    `placed` is the number of cells that were set and `removed` the number of
+    candidates that were removed by `remove_possible` actions, without the
+    candidates removed from the peers of the placed cells.
+    """
+
+    changed: list[bool]
+    placed: int
+    removed: int
 
 
 class Field:
@@ -13,9 +52,16 @@ class Field:
     The Field is a collection of 81 cells of a sudoku puzzle.
 
     Is contains some methods to interact with them.
+
+    The values and possible numbers of all cells are stored in a single
+    :class:`sudoku.grid.Grid`, the cells are views on it that are created on
+    first access.
+
+    When a :class:`sudoku.journal.Journal` is attached as `journal`, all changes of
+    :meth:`place` and :meth:`apply` are recorded, so they can be undone.
     """
 
-    __slots__ = ["cells"]
+    __slots__ = ["_cells", "_peers", "_units", "grid", "journal", "record_reasons"]
 
     _groups = (
         "row",
@@ -23,13 +69,160 @@ class Field:
         "block",
     )
 
-    def __init__(self, cell_string: str) -> None:
-        self.cells: list[Cell] = [
-            Cell(value=int(value), position=CellPosition.from_int(position))
-            for position, value in enumerate(
-                filter(lambda x: "0" <= x <= "9", cell_string)
+    def __init__(self, cell_string: str, record_reasons: bool = True) -> None:
+        """
+        creates a field from a string of the cell values, row by row.
+
+        All characters except `0` to `9` are ignored, `0` is an empty cell.
+        Missing cells at the end are empty.
+
+        When `record_reasons` is `False`, eliminations are not added to the log of
+        the grid.
+        """
+        digits = cell_string.encode("ascii", "ignore").translate(None, _NOT_DIGITS)
+        if len(digits) > 81:
+            raise ValueError(f"a field has 81 cells, but got {len(digits)} values")
+        self._init(Grid.fromvalues(digits.ljust(81, b"0").translate(_TO_VALUES)))
+        self.record_reasons: bool = record_reasons
+
+    def _init(self, grid: Grid) -> None:
+        self.grid: Grid = grid
+        self.journal: Journal | None = None
+        self._cells: list[Cell] | None = None
+        self._units: tuple[tuple[Cell, ...], ...] | None = None
+        self._peers: tuple[tuple[Cell, ...], ...] | None = None
+
+    @staticmethod
+    def _parse(puzzle: str | bytes) -> bytes:
+        """
+        returns the values of exactly 81 characters `0` to `9` or `.` as bytes.
+        """
+        data = puzzle.encode() if isinstance(puzzle, str) else bytes(puzzle)
+        if len(data) != 81 or data.translate(None, _DIGITS + b"."):
+            raise ValueError(f"expected 81 characters 0 to 9 or ., but got {puzzle!r}")
+        return data.translate(_TO_VALUES)
+
+    @classmethod
+    def from_grid(cls, grid: Grid, record_reasons: bool = True) -> Field:
+        """
+        returns a field that uses `grid` as its storage, without copying it.
+        """
+        field = cls.__new__(cls)
+        field._init(grid)
+        field.record_reasons = record_reasons
+        return field
+
+    @classmethod
+    def from_string(cls, puzzle: str | bytes, record_reasons: bool = True) -> Field:
+        """
+        returns a field from exactly 81 characters `0` to `9` or `.` for empty cells.
+
+        Unlike the constructor it doesn't skip other characters, but raises a
+        ValueError for any other input.
+        """
+        return cls.from_grid(Grid.fromvalues(cls._parse(puzzle)), record_reasons)
+
+    @classmethod
+    def from_masks(
+        cls,
+        values: Iterable[CellValue],
+        candidates: Iterable[CandidateMask],
+        record_reasons: bool = True,
+    ) -> Field:
+        """
+        returns a field from the 81 values and candidate masks of its cells.
+        """
+        grid = Grid(values, candidates)
+        if len(grid) != 81:
+            raise ValueError(f"a field has 81 cells, but got {len(grid)} values")
+        return cls.from_grid(grid, record_reasons)
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes, record_reasons: bool = True) -> Field:
+        """
+        returns a field from the output of `bytes(field)`.
+        """
+        grid = Grid.frombytes(buffer)
+        if len(grid) != 81 or len(buffer) != 3 * 81:
+            raise ValueError(f"expected {3 * 81} bytes, but got {len(buffer)}")
+        return cls.from_grid(grid, record_reasons)
+
+    def reset(self, puzzle: str | bytes) -> None:
+        """
+        replaces the board with a new puzzle of exactly 81 characters `0` to `9` or
+        `.` for empty cells.
+
+        The grid and the cells are reused, so solving a stream of puzzles with one
+        field doesn't allocate new cells for every puzzle.
+        """
+        fresh = Grid.fromvalues(self._parse(puzzle))
+        grid = self.grid
+        grid.values[:] = fresh.values
+        grid.candidates[:] = fresh.candidates
+        grid.log = []
+        grid.touch_all()
+        if self.journal is not None:
+            self.journal.clear()
+
+    def copy(self) -> Field:
+        """
+        returns an independent copy of the field, without a journal.
+
+        Only the values and candidates are copied, the log is shared until one of
+        the fields changes it, see :class:`sudoku.grid.Grid`.
+        """
+        return Field.from_grid(self.grid.copy(), self.record_reasons)
+
+    def snapshot(self) -> Snapshot:
+        """
+        returns the current state of the field, to go back to it with :meth:`restore`.
+
+        A snapshot is immutable and can be restored any number of times.
+        """
+        return self.grid.snapshot()
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        brings the field back to the state of the snapshot.
+
+        The cells stay valid, the board is written in place. The journal is cleared.
+        """
+        self.grid.restore(snapshot)
+        if self.journal is not None:
+            self.journal.clear()
+
+    @property
+    def cells(self) -> list[Cell]:
+        """
+        all 81 cells of the field, row by row.
+        """
+        if self._cells is None:
+            grid = self.grid
+            self._cells = [Cell.view(grid, index) for index in range(81)]
+        return self._cells
+
+    @property
+    def units(self) -> tuple[tuple[Cell, ...], ...]:
+        """
+        all 27 units of the field, first the rows, then the columns and then the blocks.
+
+        see :mod:`sudoku.units` for the order of the units and their cells.
+        """
+        if self._units is None:
+            cells = self.cells
+            self._units = tuple(tuple(cells[index] for index in unit) for unit in UNITS)
+        return self._units
+
+    def peers(self, cell: Cell) -> tuple[Cell, ...]:
+        """
+        returns the 20 cells that share a row, column or block with `cell`.
+        """
+        if self._peers is None:
+            cells = self.cells
+            self._peers = tuple(
+                tuple(cells[index] for index in peers) for peers in PEERS
             )
-        ]
+        return self._peers[cell.position.as_int()]
 
     def get_cell(self, x: int, y: int) -> Cell:
         """
@@ -40,55 +233,241 @@ class Field:
 
     def set_cell(self, x: int, y: int, value: CellValue) -> None:
         """
-        Sets the value of a cell with the given x and y coordinate.
+        Sets the value of a cell with the given x and y coordinate and removes the
+        value from the possible numbers of its peers.
+        """
+        self.place(x + 9 * y, value)
+
+    def place(
+        self, index: int, value: CellValue, reason: str | Reason | None = None
+    ) -> None:
+        """
+        Sets the value of the cell `index` and removes the value from the possible
+        numbers of its 20 peers.
+
+        It will raise an AssertionError when the value is not possible for the cell.
+
+        The eliminations are added to the log with `reason`, when reasons are recorded.
         """
-        self.get_cell(x, y).value = value
+        grid = self.grid
+        candidates = grid.candidates
+        bit = BIT[value]
+        assert candidates[index] & bit, (
+            f"Cell {POSITIONS[index]} can't be set to {value}"
+        )
+        journal = self.journal
+        if journal is not None:
+            journal.record(index)
+        grid.values[index] = value
+        candidates[index] = 0
+        grid.touch(index)
+        generation = grid.generation
+        unit_generations = grid.unit_generations
+        record: str | Reason | None = None
+        if self.record_reasons:
+            if reason is None:
+                reason = Reason(Technique.PLACED, "", (index,), (value,))
+            record = reason
+        # only copy a shared log when there is something to add
+        log = grid.writable_log() if record is not None else []
+        for peer in PEERS[index]:
+            if candidates[peer] & bit:
+                if journal is not None:
+                    journal.record(peer)
+                candidates[peer] &= ~bit
+                for unit in CELL_UNITS[peer]:
+                    unit_generations[unit] = generation
+                if record is not None:
+                    log.append((peer, value, record))
 
-    def get_group(self, type: str, idx: int) -> set[Cell]:
+    def get_group(self, type: str, idx: int) -> tuple[Cell, ...]:
         """
-        returns a set of cells of the same group.
+        returns a tuple of cells of the same group, ordered by their position.
 
         `type` is either a `row`, `column`, or `block`
         `idx` is the index of the group regarding to the :class:`sudoku.types.CellPosition`
         """
-        test = {
-            "row": lambda cell, idx: cell.position.row == idx,
-            "column": lambda cell, idx: cell.position.column == idx,
-            "block": lambda cell, idx: cell.position.block == idx,
-        }[type]
-        return {cell for cell in self.cells if test(cell, idx)}
+        return self.units[unit_id(type, idx)]
+
+    def apply(self, action: Action) -> bool:
+        """
+        applies the action to the field and returns `True` when the field changed.
 
-    def apply(self, action: Action) -> None:
+        Setting a cell removes the value from the possible numbers of its peers.
+        Setting a cell to the value it already has does not change the field.
+        Setting a cell to a value that is not possible raises an AssertionError.
+        """
+        cell = action.cell
         if action.action == "remove_possible":
-            action.cell.hopeful -= {action.value}
-            action.cell._debug.append((action.value, action.reason))
+            if not cell.candidates & BIT[action.value]:
+                return False
+            if self.journal is not None:
+                self.journal.record(cell.index)
+            cell.candidates &= ~BIT[action.value]  # marks the units as changed
+            if self.record_reasons and action.reason is not None:
+                self.grid.writable_log().append(
+                    (cell.index, action.value, action.reason)
+                )
+            return True
         elif action.action == "set_number":
-            action.cell.value = action.value
+            if cell.value == action.value:
+                return False
+            self.place(cell.index, action.value)
+            return True
+        return False
+
+    def apply_many(self, actions: Iterable[Action]) -> ApplySummary:
+        """
+        applies all actions at once and returns which of them changed the field.
+
+        Actions with the same cell, value and kind are applied only once. All
+        eliminations are applied as one mask per cell before the cells are set.
+
+        The placements are checked before anything is changed. When a cell would be
+        set to two values, to a value that is not possible, or when a value would be
+        set twice in a unit, it raises an AssertionError and the field is unchanged.
+        """
+        grid = self.grid
+        values = grid.values
+        candidates = grid.candidates
+        changed: list[bool] = []
+        seen: set[tuple[int, CellValue, str]] = set()
+        removals: dict[int, CandidateMask] = {}
+        placements: dict[int, CellValue] = {}
+        log: list[tuple[int, CellValue, str | Reason]] = []
+        for action in actions:
+            index = action.cell.index
+            value = action.value
+            key = (index, value, action.action)
+            if key in seen:
+                changed.append(False)
+                continue
+            seen.add(key)
+            if action.action == "remove_possible":
+                bit = BIT[value]
+                if candidates[index] & bit:
+                    removals[index] = removals.get(index, 0) | bit
+                    if self.record_reasons and action.reason is not None:
+                        log.append((index, value, action.reason))
+                    changed.append(True)
+                else:
+                    changed.append(False)
+            elif action.action == "set_number" and values[index] != value:
+                if index in placements:
+                    raise AssertionError(
+                        f"Cell {POSITIONS[index]} can't be set to "
+                        f"{placements[index]} and {value}"
+                    )
+                placements[index] = value
+                changed.append(True)
+            else:
+                changed.append(False)
+
+        used = [0] * len(UNITS)
+        for index, value in placements.items():
+            bit = BIT[value]
+            assert candidates[index] & ~removals.get(index, 0) & bit, (
+                f"Cell {POSITIONS[index]} can't be set to {value}"
+            )
+            for unit in CELL_UNITS[index]:
+                assert not used[unit] & bit, (
+                    f"{value} is set twice in the unit of {POSITIONS[index]}"
+                )
+                used[unit] |= bit
+
+        if removals:
+            journal = self.journal
+            grid.generation += 1
+            generation = grid.generation
+            unit_generations = grid.unit_generations
+            for index, mask in removals.items():
+                if journal is not None:
+                    journal.record(index)
+                candidates[index] &= ~mask
+                for unit in CELL_UNITS[index]:
+                    unit_generations[unit] = generation
+            if log:
+                grid.writable_log().extend(log)
+        for index, value in placements.items():
+            self.place(index, value)
+        removed = sum(POPCOUNT[mask] for mask in removals.values())
+        return ApplySummary(changed, len(placements), removed)
+
+    def solve(self, fallback: bool = False) -> SolveResult:
+        """
+        runs all solvers until the field is solved or they get stuck.
+
+        With `fallback` a stuck field is solved by an exact cover search.
+
+        see :func:`sudoku.engine.solve`
+        """
+        from sudoku.engine import solve
+
+        return solve(self, fallback=fallback)
+
+    def count_solutions(self, limit: int | None = 2) -> int:
+        """
+        returns the number of solutions, but stops counting at `limit`.
+
+        A valid puzzle has exactly one solution, see :mod:`sudoku.solver.uniqueness`.
+        """
+        from sudoku.solver.uniqueness import count_solutions
+
+        return count_solutions(self, limit)
+
+    def save(self, path: Path, binary: bool = False, log: bool = False) -> None:
+        """
+        saves the values and possible numbers of all cells.
 
-    def save(self, path: Path) -> None:
+        By default one JSON object per cell is written. With `binary` the compact
+        format of :mod:`sudoku.savegame` is used, which also stores the elimination
+        log when `log` is set.
+        """
+        grid = self.grid
+        if binary:
+            path.write_bytes(savegame.dumps(grid, log=log))
+            return
         cells = [
             json.dumps(
                 dict(
-                    value=cell.value,
-                    position=cell.position.as_int(),
-                    hopeful=list(cell.hopeful),
+                    value=grid.values[index],
+                    position=index,
+                    hopeful=list(DIGITS[grid.candidates[index]]),
                 )
             )
-            for cell in self.cells
+            for index in range(81)
         ]
         path.write_text("\n".join(cells))
 
     def load(self, path: Path) -> None:
+        """
+        loads a board written by :meth:`save`, in either format.
+        """
+        content = path.read_bytes()
+        if self.journal is not None:
+            self.journal.clear()
+        if savegame.is_savegame(content):
+            savegame.loads(content, self.grid)
+            return
         cell_definition_lookup = dict()
-        for cell_line in path.read_text().splitlines():
+        for cell_line in content.decode().splitlines():
             cell_definiton = json.loads(cell_line)
             cell_definition_lookup[cell_definiton["position"]] = cell_definiton
         assert len(cell_definition_lookup) == 81
-        for cell in self.cells:
-            cell_definiton = cell_definition_lookup[cell.position.as_int()]
-            cell._value = cell_definiton["value"]
-            cell.hopeful |= {1, 2, 3, 4, 5, 6, 7, 8, 9}
-            cell.hopeful &= set(cell_definiton["hopeful"])
+        grid = self.grid
+        for index in range(81):
+            cell_definiton = cell_definition_lookup[index]
+            grid.values[index] = cell_definiton["value"]
+            grid.candidates[index] = ALL_CANDIDATES & mask_of(cell_definiton["hopeful"])
+        # like the binary format, the JSON format has no log
+        grid.log = []
+        grid.touch_all()
+
+    def __bytes__(self) -> bytes:
+        """
+        returns the values and possible numbers of all cells as a single buffer.
+        """
+        return bytes(self.grid)
 
     def __str__(self) -> str:
         light_row = f"+{'   +' * 9}\n"
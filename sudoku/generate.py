@@ -0,0 +1,332 @@
+"""
+Generate random puzzles with a unique solution and a requested difficulty.
+
+A puzzle is made from a random solution grid by removing clues, a whole symmetry
+orbit at a time, as long as the puzzle keeps a unique solution. The difficulty is
+the hardest technique of :data:`sudoku.solver.weighted_solvers` the engine needs
+to solve the puzzle, see :mod:`sudoku.grade`. Puzzles outside the requested band
+are thrown away.
+
+The same seed always generates the same puzzles, also when they are generated
+in parallel.
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import os
+import random
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, NamedTuple
+
+from .batch import positive_int
+from .field import Field
+from .grade import WEIGHTS, grade
+from .solver.backtracking import solve as search
+from .solver.uniqueness import count_solutions
+from .units import POSITIONS
+
+_TO_DIGITS = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+MAX_ATTEMPTS = 10_000
+"""
+The default number of puzzles in a row :func:`puzzles` may throw away.
+"""
+
+
+class Symmetry(enum.Enum):
+    """
+    The symmetry of the clues of a puzzle.
+
+    - `ROTATIONAL` is point symmetric to the center cell
+    - `MIRROR` is mirrored at the middle column
+    - `DIAGONAL` is mirrored at the diagonal from the top left to the bottom right
+    """
+
+    NONE = enum.auto()
+    ROTATIONAL = enum.auto()
+    MIRROR = enum.auto()
+    DIAGONAL = enum.auto()
+
+    def orbit(self, index: int) -> frozenset[int]:
+        """
+        returns the cells that have to be removed together with the cell `index`.
+        """
+        x, y = POSITIONS[index]
+        if self is Symmetry.ROTATIONAL:
+            other = (8 - x) + 9 * (8 - y)
+        elif self is Symmetry.MIRROR:
+            other = (8 - x) + 9 * y
+        elif self is Symmetry.DIAGONAL:
+            other = y + 9 * x
+        else:
+            other = index
+        return frozenset((index, other))
+
+
+class Puzzle(NamedTuple):
+    """
+    `puzzle` and `solution` contain the values of all 81 cells, `0` for empty cells.
+
+    `hardest` is the name of the hardest technique needed to solve the puzzle, or
+    `None` when the techniques get stuck and the puzzle needs a search.
+    """
+
+    puzzle: str
+    solution: str
+    clues: int
+    hardest: str | None
+
+    def __str__(self) -> str:
+        return f"{self.puzzle}\t{self.clues}\t{self.hardest or 'search'}"
+
+
+def solution_grid(rng: random.Random) -> list[int]:
+    """
+    returns the values of a random solved grid.
+    """
+    # the three blocks on the diagonal don't see each other and can be filled freely
+    field = Field("")
+    for block in (0, 4, 8):
+        values = rng.sample(range(1, 10), 9)
+        cells = [
+            index for index, position in enumerate(POSITIONS) if position.block == block
+        ]
+        for index, value in zip(cells, values):
+            field.place(index, value)
+    solution = search(field)
+    assert solution is not None
+    return solution
+
+
+def hardest_technique(puzzle: str) -> str | None:
+    """
+    returns the name of the hardest technique the engine needs to solve the puzzle,
+    or `None` when the techniques get stuck.
+    """
+    result = grade(Field.from_string(puzzle, record_reasons=False))
+    return result.hardest if result.solved else None
+
+
+def remove_clues(
+    solution: list[int],
+    rng: random.Random,
+    symmetry: Symmetry = Symmetry.NONE,
+    min_clues: int = 17,
+) -> list[int]:
+    """
+    returns the values of a puzzle with the unique solution `solution`.
+
+    The cells are tried in random order and removed with their symmetry orbit,
+    when the puzzle stays unique. It stops when `min_clues` clues are left.
+    """
+    values = list(solution)
+    clues = 81
+    order = list(range(81))
+    rng.shuffle(order)
+    seen: set[int] = set()
+    for index in order:
+        if index in seen:
+            continue
+        orbit = symmetry.orbit(index)
+        seen |= orbit
+        if clues - len(orbit) < min_clues:
+            continue
+        removed = values.copy()
+        for cell in orbit:
+            removed[cell] = 0
+        if (
+            count_solutions(
+                Field.from_string(bytes(removed).translate(_TO_DIGITS)), limit=2
+            )
+            == 1
+        ):
+            values = removed
+            clues -= len(orbit)
+    return values
+
+
+def check_options(
+    *,
+    min_clues: int = 17,
+    max_clues: int = 81,
+    easiest: str | None = None,
+    hardest: str | None = None,
+    **options: Any,
+) -> None:
+    """
+    raises a ValueError when no puzzle can meet the options of :func:`puzzles`.
+    """
+    for technique in (easiest, hardest):
+        if technique is not None and technique not in WEIGHTS:
+            raise ValueError(f"unknown technique {technique!r}")
+    if (
+        easiest is not None
+        and hardest is not None
+        and WEIGHTS[easiest] > WEIGHTS[hardest]
+    ):
+        raise ValueError(f"{easiest} is harder than {hardest}")
+    if min_clues > max_clues:
+        raise ValueError(f"min_clues {min_clues} is larger than max_clues {max_clues}")
+    if max_clues < 17:
+        raise ValueError(f"a unique puzzle has at least 17 clues, not {max_clues}")
+
+
+def puzzles(
+    seed: int | None = None,
+    *,
+    symmetry: Symmetry = Symmetry.NONE,
+    min_clues: int = 17,
+    max_clues: int = 81,
+    easiest: str | None = None,
+    hardest: str | None = None,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> Iterator[Puzzle]:
+    """
+    yields an endless stream of random puzzles.
+
+    Only puzzles with at most `max_clues` clues are yielded. When `easiest` or
+    `hardest` are given, the hardest technique needed to solve the puzzle must
+    have at least the weight of `easiest` and at most the weight of `hardest`.
+    Puzzles that need a search are only yielded without `hardest`.
+
+    For example `easiest="x_wing", hardest="x_wing"` yields puzzles that need an
+    x-wing, but nothing harder.
+
+    Options no puzzle can meet raise a ValueError, see :func:`check_options`.
+    When `max_attempts` puzzles in a row are thrown away, a RuntimeError is raised.
+    """
+    check_options(
+        min_clues=min_clues, max_clues=max_clues, easiest=easiest, hardest=hardest
+    )
+    low = WEIGHTS[easiest] if easiest is not None else None
+    high = WEIGHTS[hardest] if hardest is not None else None
+    rng = random.Random(seed)
+    attempts = 0
+    while True:
+        if attempts >= max_attempts:
+            raise RuntimeError(f"no puzzle met the options in {attempts} attempts")
+        attempts += 1
+        solution = solution_grid(rng)
+        values = remove_clues(solution, rng, symmetry, min_clues)
+        clues = sum(1 for value in values if value)
+        if clues > max_clues:
+            continue
+        puzzle = "".join(map(str, values))
+        technique = hardest_technique(puzzle)
+        if technique is None:
+            if high is not None:
+                continue
+        else:
+            weight = WEIGHTS[technique]
+            if low is not None and weight < low:
+                continue
+            if high is not None and weight > high:
+                continue
+        attempts = 0
+        yield Puzzle(puzzle, "".join(map(str, solution)), clues, technique)
+
+
+def generate(seed: int | None = None, **options: Any) -> Puzzle:
+    """
+    returns a single random puzzle, see :func:`puzzles` for the options.
+    """
+    return next(puzzles(seed, **options))
+
+
+def generate_many(
+    count: int, seed: int | None = None, workers: int | None = None, **options: Any
+) -> Iterator[Puzzle]:
+    """
+    yields `count` random puzzles generated by a pool of `workers` processes.
+
+    Each puzzle gets its own seed derived from `seed`, so the result does not
+    depend on the number of workers. See :func:`puzzles` for the options.
+    """
+    check_options(**options)
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(64) for _ in range(count)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, not {workers}")
+    if workers == 1:
+        yield from map(partial(generate, **options), seeds)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(generate, **options), seeds)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-n", "--count", type=int, default=1, help="number of puzzles (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed of the generator")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=positive_int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--symmetry",
+        choices=[symmetry.name.lower() for symmetry in Symmetry],
+        default="none",
+        help="symmetry of the clues (default: none)",
+    )
+    parser.add_argument(
+        "--min-clues",
+        type=int,
+        default=17,
+        help="stop removing clues at this number (default: 17)",
+    )
+    parser.add_argument(
+        "--max-clues",
+        type=int,
+        default=81,
+        help="only keep puzzles with at most this number of clues",
+    )
+    parser.add_argument(
+        "--easiest",
+        choices=list(WEIGHTS),
+        default=None,
+        help="the puzzles need at least this technique",
+    )
+    parser.add_argument(
+        "--hardest",
+        choices=list(WEIGHTS),
+        default=None,
+        help="the puzzles need nothing harder than this technique",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=MAX_ATTEMPTS,
+        help="give up after this many puzzles in a row were thrown away "
+        f"(default: {MAX_ATTEMPTS})",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    try:
+        for puzzle in generate_many(
+            args.count,
+            args.seed,
+            args.workers,
+            symmetry=Symmetry[args.symmetry.upper()],
+            min_clues=args.min_clues,
+            max_clues=args.max_clues,
+            easiest=args.easiest,
+            hardest=args.hardest,
+            max_attempts=args.max_attempts,
+        ):
+            print(puzzle, file=sys.stdout)
+    except RuntimeError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    return 0
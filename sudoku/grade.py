@@ -0,0 +1,67 @@
+"""
+Grade the difficulty of a puzzle with the weights of :data:`sudoku.solver.weighted_solvers`.
+
+The engine always applies the cheapest technique that changes the field, so the
+techniques a puzzle needs are the ones that took a step. The hardest of them
+defines the difficulty.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import NamedTuple
+
+from .engine import SolveStatus, Step, solve
+from .field import Field
+from .solver import weighted_solvers
+
+WEIGHTS: dict[str, int] = {
+    solver.__name__: weight for weight, solver in weighted_solvers
+}
+"""
+`WEIGHTS[name]` is the weight of the technique `name`.
+"""
+
+
+class Grade(NamedTuple):
+    """
+    `status` is the status of the engine after the last step.
+
+    `hardest` is the name of the hardest technique that was needed, `None` when
+    no step was needed at all.
+
+    `steps` is the number of steps per technique.
+
+    `score` is the sum of the weights of all steps. A puzzle the techniques get
+    stuck on is harder than its score tells, check `status`.
+    """
+
+    status: SolveStatus
+    hardest: str | None
+    steps: dict[str, int]
+    score: int
+
+    @property
+    def solved(self) -> bool:
+        """
+        `True` when the techniques solved the puzzle without any search.
+        """
+        return self.status == SolveStatus.SOLVED
+
+
+def grade(field: Field) -> Grade:
+    """
+    returns the grade of the field.
+
+    Like :func:`sudoku.engine.solve` this solves the field in place. Create the
+    field with `record_reasons=False` when grading many puzzles.
+    """
+    steps: Counter[str] = Counter()
+
+    def count(step: Step) -> None:
+        steps[step.solver] += 1
+
+    result = solve(field, on_step=count)
+    hardest = max(steps, key=WEIGHTS.__getitem__, default=None)
+    score = sum(WEIGHTS[name] * count for name, count in steps.items())
+    return Grade(result.status, hardest, dict(steps), score)
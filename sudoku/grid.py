@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from .candidates import ALL_CANDIDATES, CandidateMask
+from .reason import Reason
+from .types import CellValue
+from .units import CELL_UNITS
+
+# translation tables from values to the low and high byte of their initial mask
+_EMPTY_LOW = bytes([ALL_CANDIDATES & 0xFF]) + bytes(255)
+_EMPTY_HIGH = bytes([ALL_CANDIDATES >> 8]) + bytes(255)
+_FIRST, _SECOND = (
+    (_EMPTY_LOW, _EMPTY_HIGH)
+    if sys.byteorder == "little"
+    else (_EMPTY_HIGH, _EMPTY_LOW)
+)
+
+
+class Snapshot(NamedTuple):
+    """
+    The state of a :class:`Grid` at one point in time, see :meth:`Grid.snapshot`.
+
+    `board` is `bytes(grid)` and `log_size` the length of the log at that time.
+    """
+
+    board: bytes
+    log_size: int
+
+
+class Grid:
+    """
+    The Grid is the storage of a :class:`sudoku.field.Field`.
+
+    It keeps the values and the candidate masks of all cells in two flat arrays,
+    so copying, hashing or serializing a board is a single buffer operation.
+    A :class:`sudoku.cell.Cell` is only a view on one index of a Grid.
+
+    `values` contains the value of each cell, `0` when the cell is not set.
+
+    `candidates` contains the candidate mask of each cell, see :mod:`sudoku.candidates`.
+
+    `log` is a list of `(index, value, reason)` tuples, that explain why a number is not
+    possible anymore. The reasons are rendered to text only when they are read, see
+    :mod:`sudoku.reason`.
+
+    `generation` is increased on every change of a cell, `unit_generations` contains for
+    each unit id of :mod:`sudoku.units` the generation of its last change. Solvers can
+    use them to skip units that did not change since they looked at them.
+
+    Copies share the log with the original until one of them changes it, so
+    copying a board never copies the log, unless a copy adds to it. Change the
+    log only with :meth:`writable_log`, :meth:`truncate_log` or by assigning a
+    new list.
+    """
+
+    __slots__ = [
+        "_log",
+        "_owns_log",
+        "candidates",
+        "generation",
+        "unit_generations",
+        "values",
+    ]
+
+    def __init__(
+        self,
+        values: Iterable[CellValue],
+        candidates: Iterable[CandidateMask] | None = None,
+    ) -> None:
+        self.values: array[int] = array("B", values)
+        if candidates is None:
+            candidates = (0 if value else ALL_CANDIDATES for value in self.values)
+        self.candidates: array[int] = array("H", candidates)
+        self.log: list[tuple[int, CellValue, str | Reason]] = []
+        self.generation: int = 0
+        self.unit_generations: array[int] = array("Q", bytes(8 * 27))
+        assert len(self.values) == len(self.candidates)
+
+    @classmethod
+    def fromvalues(cls, values: bytes) -> Grid:
+        """
+        returns a new Grid from one byte per cell with its value, `0` for empty cells.
+
+        It does the same as `Grid(values)`, without a loop in Python.
+        """
+        masks = bytearray(2 * len(values))
+        masks[0::2] = values.translate(_FIRST)
+        masks[1::2] = values.translate(_SECOND)
+        grid = cls.__new__(cls)
+        grid.values = array("B", values)
+        grid.candidates = array("H")
+        grid.candidates.frombytes(masks)
+        grid.log = []
+        grid.generation = 0
+        grid.unit_generations = array("Q", bytes(8 * 27))
+        return grid
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def copy(self) -> Grid:
+        """
+        returns an independent copy of this grid.
+        """
+        grid = Grid.__new__(Grid)
+        grid.values = array("B", self.values)
+        grid.candidates = array("H", self.candidates)
+        # copy on write, the log is copied by the first grid that changes it
+        grid._log = self._log
+        grid._owns_log = False
+        self._owns_log = False
+        grid.generation = self.generation
+        grid.unit_generations = array("Q", self.unit_generations)
+        return grid
+
+    @property
+    def log(self) -> list[tuple[int, CellValue, str | Reason]]:
+        """
+        the log for reading, it may be shared with copies of the grid.
+        """
+        return self._log
+
+    @log.setter
+    def log(self, log: list[tuple[int, CellValue, str | Reason]]) -> None:
+        self._log = log
+        self._owns_log = True
+
+    def writable_log(self) -> list[tuple[int, CellValue, str | Reason]]:
+        """
+        returns the log to add entries to, it is copied first when it is shared.
+        """
+        if not self._owns_log:
+            self._log = list(self._log)
+            self._owns_log = True
+        return self._log
+
+    def truncate_log(self, size: int) -> None:
+        """
+        removes all entries after the first `size` entries of the log.
+        """
+        if len(self._log) <= size:
+            return
+        if self._owns_log:
+            del self._log[size:]
+        else:
+            self.log = self._log[:size]
+
+    def snapshot(self) -> Snapshot:
+        """
+        returns the current state, that can be brought back with :meth:`restore`.
+        """
+        return Snapshot(bytes(self), len(self.log))
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        writes the values and candidates of the snapshot back in place and removes
+        the log entries that were added after it.
+
+        Entries that were removed from the log since the snapshot can't be restored.
+        """
+        board = snapshot.board
+        size = len(self.values)
+        self.values[:] = array("B", board[:size])
+        candidates = array("H")
+        candidates.frombytes(board[size:])
+        self.candidates[:] = candidates
+        self.truncate_log(snapshot.log_size)
+        # candidates may grow again, so every unit has to be revisited
+        self.touch_all()
+
+    def __bytes__(self) -> bytes:
+        return self.values.tobytes() + self.candidates.tobytes()
+
+    @classmethod
+    def frombytes(cls, buffer: bytes) -> Grid:
+        """
+        returns a new Grid from the output of `bytes(grid)`.
+        """
+        size = len(buffer) // 3
+        grid = cls.__new__(cls)
+        grid.values = array("B", buffer[:size])
+        grid.candidates = array("H")
+        grid.candidates.frombytes(buffer[size:])
+        grid.log = []
+        grid.generation = 0
+        grid.unit_generations = array("Q", bytes(8 * 27))
+        return grid
+
+    def touch(self, index: int) -> None:
+        """
+        marks the units of the cell `index` as changed.
+        """
+        self.generation += 1
+        generation = self.generation
+        unit_generations = self.unit_generations
+        for unit in CELL_UNITS[index]:
+            unit_generations[unit] = generation
+
+    def touch_all(self) -> None:
+        """
+        marks all units as changed.
+        """
+        self.generation += 1
+        self.unit_generations = array("Q", [self.generation] * 27)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.values == other.values and self.candidates == other.candidates
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,180 @@
+"""
+Undo and redo changes of a :class:`sudoku.field.Field`.
+
+While a journal is attached to a field, :meth:`sudoku.field.Field.place` and
+:meth:`sudoku.field.Field.apply` record the previous value and candidates of
+every cell they change on a trail. Going back to a mark restores the cells in
+reverse order, so it takes time proportional to the changes that are undone and
+not to the size of the board.
+
+Every entry of the trail is a single integer, the index of the cell in the lowest
+7 bits, its value in the next 4 bits and its candidate mask above them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+from .types import CellValue
+
+if TYPE_CHECKING:
+    from .field import Field
+    from .reason import Reason
+
+_INDEX_BITS = 7
+_VALUE_BITS = 4
+_MASK_SHIFT = _INDEX_BITS + _VALUE_BITS
+
+
+class Mark(NamedTuple):
+    """
+    A position in the journal, `trail` is the length of the trail and `log` the
+    length of the elimination log of the grid at that time.
+    """
+
+    trail: int
+    log: int
+
+
+class _Redo(NamedTuple):
+    """
+    The changes of one undone step, `trail` are the undone entries, `after` the
+    states of their cells before they were undone and `log` the undone log entries.
+    """
+
+    trail: array[int]
+    after: array[int]
+    log: list[tuple[int, CellValue, str | Reason]]
+
+
+class Journal:
+    """
+    The trail of changes of a field, with marks to go back to.
+
+    Creating a journal attaches it to the field, :meth:`detach` stops recording.
+
+    :meth:`mark` and :meth:`rollback` are the primitives for a search, that tries
+    a value and goes back when it leads to a contradiction. :meth:`undo` and
+    :meth:`redo` move between the marks, like the undo of an editor.
+    """
+
+    __slots__ = ["_redo", "field", "marks", "trail"]
+
+    def __init__(self, field: Field) -> None:
+        self.field: Field = field
+        self.trail: array[int] = array("L")
+        self.marks: list[Mark] = []
+        self._redo: list[_Redo] = []
+        field.journal = self
+
+    def detach(self) -> None:
+        """
+        stops recording the changes of the field.
+        """
+        if self.field.journal is self:
+            self.field.journal = None
+
+    def record(self, index: int) -> None:
+        """
+        records the current state of the cell `index`, before it is changed.
+        """
+        grid = self.field.grid
+        self.trail.append(
+            index
+            | grid.values[index] << _INDEX_BITS
+            | grid.candidates[index] << _MASK_SHIFT
+        )
+
+    def clear(self) -> None:
+        """
+        forgets all changes and marks, for example after the board was replaced.
+        """
+        del self.trail[:]
+        self.marks.clear()
+        self._redo.clear()
+
+    def position(self) -> Mark:
+        """
+        returns the current position, without adding it to the marks.
+        """
+        return Mark(len(self.trail), len(self.field.grid.log))
+
+    def mark(self) -> Mark:
+        """
+        adds the current position to the marks and returns it.
+
+        New changes make the undone steps unavailable for :meth:`redo`.
+        """
+        mark = self.position()
+        self.marks.append(mark)
+        self._redo.clear()
+        return mark
+
+    def _restore(self, mark: Mark) -> _Redo:
+        """
+        restores all cells that changed after the mark and returns what was undone.
+        """
+        grid = self.field.grid
+        values = grid.values
+        candidates = grid.candidates
+        trail = self.trail
+        undone = trail[mark.trail :]
+        after = array("L")
+        for entry in reversed(undone):
+            index = entry & 0x7F
+            after.append(
+                index | values[index] << _INDEX_BITS | candidates[index] << _MASK_SHIFT
+            )
+            values[index] = entry >> _INDEX_BITS & 0xF
+            candidates[index] = entry >> _MASK_SHIFT
+        after.reverse()
+        del trail[mark.trail :]
+        log = grid.log[mark.log :]
+        grid.truncate_log(mark.log)
+        if undone:
+            # candidates grew again, so every unit has to be revisited
+            grid.touch_all()
+        return _Redo(undone, after, log)
+
+    def rollback(self, mark: Mark) -> None:
+        """
+        undoes all changes after the mark and removes the mark and all later marks.
+
+        The undone changes can't be redone.
+        """
+        marks = self.marks
+        while marks and marks[-1].trail > mark.trail:
+            marks.pop()
+        if marks and marks[-1] == mark:
+            marks.pop()
+        self._restore(mark)
+        self._redo.clear()
+
+    def undo(self) -> bool:
+        """
+        undoes all changes since the last mark, returns `False` when there is no mark.
+        """
+        if not self.marks:
+            return False
+        self._redo.append(self._restore(self.marks.pop()))
+        return True
+
+    def redo(self) -> bool:
+        """
+        applies the last undone changes again, returns `False` when nothing was undone.
+        """
+        if not self._redo:
+            return False
+        redo = self._redo.pop()
+        self.marks.append(self.position())
+        grid = self.field.grid
+        for entry in redo.after:
+            index = entry & 0x7F
+            grid.values[index] = entry >> _INDEX_BITS & 0xF
+            grid.candidates[index] = entry >> _MASK_SHIFT
+        self.trail.extend(redo.trail)
+        if redo.log:
+            grid.writable_log().extend(redo.log)
+        grid.touch_all()
+        return True
@@ -6,9 +6,10 @@ from typing import Any
 
 import pygame as pg
 
+from .. import engine
 from ..cell import Cell as SudokuCell
 from ..field import Field
-from ..solver import all_solvers, show_possibles
+from ..journal import Journal
 from .events import Event
 from .types import Surface
 from .view import View
@@ -136,6 +137,7 @@ class Board(View):
             # "100000569492056108056109240009640801064010000218035604040500016905061402621000005"
             "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
         )
+        self.journal: Journal = Journal(self.field)
         self.font: pg.font.Font = pg.font.SysFont("Vera", 42)
         self.blocks: list[Block] = []
         self.cells: list[Text] = []
@@ -224,34 +226,31 @@ class Board(View):
             print("auto solve")
 
             async def auto_solve():
-                # try_again = True
-                # while try_again:
-                print("go")
-                try_again = False
-
-                for solver in all_solvers:
-                    print(solver.__name__)
-                    try:
-                        changes = list(solver(self.field))
-                        print(len(changes))
-                        for change in changes:
-                            try_again = True
-                            await asyncio.sleep(0.0)  # allow UI to update
-                            print(f"{change.reason}")
-                            self.field.apply(change)
-                            if solver.__name__ in ("solved", "singles"):
-                                for change in show_possibles(self.field):
-                                    self.field.apply(change)
-                        if try_again:
-                            break
-                    except Exception as e:
-                        print(e)
-                if try_again:
-                    pg.image.save(self.surface, f"/tmp/img{self._idx}.png")
-                    self._idx += 1
+                mark = self.journal.mark()
+                try:
+                    result = engine.step(self.field)
+                except engine.Contradiction as e:
+                    print(e)
+                    self.journal.rollback(mark)
+                    return
+                if result is None:
+                    print("stuck")
+                    self.journal.rollback(mark)
+                    return
+                print(result.solver)
+                for change in result.actions:
+                    print(f"{change.reason}")
+                pg.image.save(self.surface, f"/tmp/img{self._idx}.png")
+                self._idx += 1
 
             asyncio.create_task(auto_solve())
             return
+        if event.key == pg.K_z:
+            print("undo" if self.journal.undo() else "nothing to undo")
+            return
+        if event.key == pg.K_y:
+            print("redo" if self.journal.redo() else "nothing to redo")
+            return
         if event.key == pg.K_s:
             print("save")
             self.field.save(Path("/tmp/sudoku.savegame"))
@@ -0,0 +1,130 @@
+"""
+Structured reasons for the actions of the solvers.
+
+A :class:`Reason` only stores which technique found an action, in which unit and
+with which cells and numbers. The text is rendered when the reason is converted
+to a string, so solvers and logs that are never read don't pay for formatting.
+All actions of one pattern share a single reason. A field created with
+`record_reasons=False` doesn't keep any reasons in its log.
+
+Reasons compare equal when all their fields are equal, compare `str(reason)` to
+check the text. Like for plain strings `"single 5" in reason` searches the text.
+"""
+
+from __future__ import annotations
+
+import enum
+
+from .types import CellValue
+from .units import POSITIONS
+
+
+class Technique(enum.Enum):
+    PLACED = enum.auto()
+    EXACT_COVER = enum.auto()
+    SOLVED = enum.auto()
+    SHOW_POSSIBLES = enum.auto()
+    SINGLE = enum.auto()
+    NAKED_PAIR = enum.auto()
+    NAKED_TRIPLE = enum.auto()
+    HIDDEN_PAIR = enum.auto()
+    HIDDEN_TRIPLE = enum.auto()
+    POINTING_PAIR = enum.auto()
+    BOX_LINE_REDUCTION = enum.auto()
+    X_WING = enum.auto()
+    SINGLE_CHAIN = enum.auto()
+
+
+class Reason:
+    """
+    Why an action was suggested.
+
+    `technique` is the :class:`Technique` that found it.
+
+    `unit` is the type of the unit the technique looked at, `row`, `column` or
+    `block`, or an empty string.
+
+    `cells` are the indices of the cells the technique is based on.
+
+    `digits` are the numbers the technique is based on.
+    """
+
+    __slots__ = ["cells", "digits", "technique", "unit"]
+
+    def __init__(
+        self,
+        technique: Technique,
+        unit: str = "",
+        cells: tuple[int, ...] = (),
+        digits: tuple[CellValue, ...] = (),
+    ) -> None:
+        self.technique: Technique = technique
+        self.unit: str = unit
+        self.cells: tuple[int, ...] = cells
+        self.digits: tuple[CellValue, ...] = digits
+
+    def __str__(self) -> str:
+        unit = self.unit
+        digits = self.digits
+        positions = [POSITIONS[index] for index in self.cells]
+        match self.technique:
+            case Technique.PLACED:
+                return f"value {digits[0]} is set at {positions[0]}"
+            case Technique.EXACT_COVER:
+                return "set by exact cover search"
+            case Technique.SOLVED:
+                return f"solved cell {digits[0]} found at {positions[0]}"
+            case Technique.SHOW_POSSIBLES:
+                return (
+                    f"value {digits[0]} is present in the same {unit} at {positions[0]}"
+                )
+            case Technique.SINGLE:
+                return f"single {digits[0]} found in {unit} at {positions[0]}"
+            case Technique.NAKED_PAIR:
+                return f"naked pair in same {unit} {digits!r} on {positions}"
+            case Technique.NAKED_TRIPLE:
+                return f"naked triple in same {unit} {digits!r} on {positions}"
+            case Technique.HIDDEN_PAIR:
+                return f"hidden pair in same {unit} {set(digits)!r} on {positions}"
+            case Technique.HIDDEN_TRIPLE:
+                return f"hidden tripple in same {unit} { {digits}!r} on {positions}"
+            case Technique.POINTING_PAIR:
+                return f"pointing pair {digits[0]} in same {unit} {positions}"
+            case Technique.BOX_LINE_REDUCTION:
+                box = positions[0].block
+                return f"box reduction {digits[0]} only in box {box} {positions}"
+            case Technique.X_WING:
+                corners = " ".join(f"{p.x},{p.y}" for p in positions)
+                return (
+                    f"X-Wing {corners}, {digits[0]} cannot occur in other cell "
+                    f"in this {unit}"
+                )
+            case Technique.SINGLE_CHAIN:
+                chain = sorted((p.x, p.y) for p in positions[1:])
+                return (
+                    f"single chain rule 4: {positions[0]} sees multiple colors of "
+                    f"chain SubChain{chain}"
+                )
+        raise ValueError(f"unknown technique {self.technique}")
+
+    def __repr__(self) -> str:
+        return (
+            f"Reason({self.technique.name}, unit={self.unit!r}, "
+            f"cells={self.cells}, digits={self.digits})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Reason):
+            return (
+                self.technique == other.technique
+                and self.unit == other.unit
+                and self.cells == other.cells
+                and self.digits == other.digits
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.technique, self.unit, self.cells, self.digits))
+
+    def __contains__(self, text: str) -> bool:
+        return text in str(self)
@@ -0,0 +1,160 @@
+"""
+A compact binary format for boards.
+
+A board is a header followed by the 81 values and the 81 candidate masks of a
+:class:`sudoku.grid.Grid`, packed little endian with a single struct. Optionally the
+elimination log follows.
+
+A container stores many boards without log in one file. All boards have the same
+size, so the board `n` can be read without reading the boards before it.
+
+The JSON lines format of :meth:`sudoku.field.Field.save` stays readable, and
+:meth:`sudoku.field.Field.load` detects the format by the magic bytes.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TypeAlias
+
+from .grid import Grid
+from .reason import Reason
+from .types import CellValue
+
+MAGIC = b"SDKB"
+CONTAINER_MAGIC = b"SDKC"
+VERSION = 1
+
+FLAG_LOG = 1
+
+HEADER = struct.Struct("<4sBBH")
+"""magic, version, flags and a reserved field"""
+BOARD = struct.Struct("<81B81H")
+"""the values and candidate masks of all cells"""
+COUNT = struct.Struct("<I")
+LOG_ENTRY = struct.Struct("<BBH")
+"""index, value and the length of the utf-8 encoded reason that follows"""
+
+CONTAINER_HEADER_SIZE = HEADER.size + COUNT.size
+
+Buffer: TypeAlias = bytes | memoryview | mmap.mmap
+"""anything the boards can be read from, like a memory mapped file"""
+
+
+def _check_header(buffer: Buffer, magic: bytes) -> int:
+    """
+    returns the flags of the header.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("buffer is too short for a savegame")
+    found, version, flags, _ = HEADER.unpack_from(buffer)
+    if found != magic:
+        raise ValueError(f"not a savegame, expected {magic!r} but got {found!r}")
+    if version != VERSION:
+        raise ValueError(f"unsupported savegame version {version}")
+    return flags
+
+
+def dumps(grid: Grid, log: bool = False) -> bytes:
+    """
+    returns the grid in the binary format, with its elimination log when `log` is set.
+    """
+    parts = [
+        HEADER.pack(MAGIC, VERSION, FLAG_LOG if log else 0, 0),
+        BOARD.pack(*grid.values, *grid.candidates),
+    ]
+    if log:
+        parts.append(COUNT.pack(len(grid.log)))
+        for index, value, reason in grid.log:
+            encoded = str(reason).encode()
+            parts.append(LOG_ENTRY.pack(index, value, len(encoded)))
+            parts.append(encoded)
+    return b"".join(parts)
+
+
+def loads(buffer: bytes | memoryview, grid: Grid | None = None) -> Grid:
+    """
+    returns the grid of a buffer in the binary format.
+
+    When `grid` is given, the board is written into it and it is returned.
+    """
+    flags = _check_header(buffer, MAGIC)
+    board = BOARD.unpack_from(buffer, HEADER.size)
+    if grid is None:
+        grid = Grid(board[:81], board[81:])
+    else:
+        grid.values[:] = array("B", board[:81])
+        grid.candidates[:] = array("H", board[81:])
+        grid.touch_all()
+    log: list[tuple[int, CellValue, str | Reason]] = []
+    if flags & FLAG_LOG:
+        offset = HEADER.size + BOARD.size
+        (count,) = COUNT.unpack_from(buffer, offset)
+        offset += COUNT.size
+        for _ in range(count):
+            index, value, length = LOG_ENTRY.unpack_from(buffer, offset)
+            offset += LOG_ENTRY.size
+            reason = bytes(buffer[offset : offset + length]).decode()
+            offset += length
+            log.append((index, value, reason))
+    grid.log = log
+    return grid
+
+
+def is_savegame(buffer: bytes | memoryview) -> bool:
+    """
+    returns `True` when the buffer starts like a board in the binary format.
+    """
+    return bytes(buffer[: len(MAGIC)]) == MAGIC
+
+
+def dump_container(path: Path, grids: Iterable[Grid]) -> int:
+    """
+    writes all grids into a container file and returns the number of boards.
+
+    The grids are written one by one, so `grids` can be a stream.
+    """
+    count = 0
+    with path.open("wb") as file:
+        file.write(HEADER.pack(CONTAINER_MAGIC, VERSION, 0, 0))
+        file.write(COUNT.pack(0))
+        for grid in grids:
+            file.write(BOARD.pack(*grid.values, *grid.candidates))
+            count += 1
+        file.seek(HEADER.size)
+        file.write(COUNT.pack(count))
+    return count
+
+
+def container_size(buffer: Buffer) -> int:
+    """
+    returns the number of boards in a container buffer.
+    """
+    _check_header(buffer, CONTAINER_MAGIC)
+    (count,) = COUNT.unpack_from(buffer, HEADER.size)
+    return count
+
+
+def container_board(buffer: Buffer, index: int) -> Grid:
+    """
+    returns the board `index` of a container buffer.
+
+    It raises an IndexError when the container has no board `index`.
+    """
+    if not 0 <= index < container_size(buffer):
+        raise IndexError("container index out of range")
+    board = BOARD.unpack_from(buffer, CONTAINER_HEADER_SIZE + index * BOARD.size)
+    return Grid(board[:81], board[81:])
+
+
+def load_container(path: Path) -> Iterator[Grid]:
+    """
+    yields all boards of a container file.
+    """
+    buffer = path.read_bytes()
+    for index in range(container_size(buffer)):
+        yield container_board(buffer, index)
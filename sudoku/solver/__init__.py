@@ -8,6 +8,7 @@ from .show_possibles import show_possibles
 from .single_chains import single_chains
 from .singles import singles
 from .solved import solved
+from .stats import SolverStats, UnitStats
 from .utils import Action
 from .x_wing import x_wing
 
@@ -30,6 +31,8 @@ all_solvers = [solver for _, solver in sorted(weighted_solvers)]
 
 __all__ = [
     "Action",
+    "SolverStats",
+    "UnitStats",
     "all_solvers",
     "hidden_pairs",
     "naked_pairs",
@@ -0,0 +1,198 @@
+"""
+Solve a :class:`sudoku.field.Field` with a depth-first search.
+
+The search keeps one 9 bit mask of the placed numbers per row, column and block,
+so the possible numbers of a cell are a few bit operations away. At every node
+naked and hidden singles are placed until nothing changes anymore, and then the
+search branches on the empty cell with the fewest possible numbers. The nodes
+are kept on an explicit stack, so there is no recursion.
+
+Only the current candidates of empty cells are considered, everything the logical
+solvers found already prunes the search.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from ..candidates import ALL_CANDIDATES, BIT, DIGITS, POPCOUNT
+from ..field import Field
+from ..types import CellValue
+from ..units import POSITIONS, UNITS
+
+_ROW = tuple(position.row for position in POSITIONS)
+_COLUMN = tuple(position.column for position in POSITIONS)
+_BLOCK = tuple(position.block for position in POSITIONS)
+
+_SOLVED = -1
+_CONTRADICTION = -2
+
+
+class SearchStats:
+    """
+    The statistics of a search.
+
+    `nodes` is the number of search nodes that were visited.
+
+    `max_depth` is the largest number of guesses on the path to a node.
+
+    `solutions` is the number of solutions that were found.
+    """
+
+    __slots__ = ["max_depth", "nodes", "solutions"]
+
+    def __init__(self) -> None:
+        self.nodes: int = 0
+        self.max_depth: int = 0
+        self.solutions: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchStats(nodes={self.nodes}, max_depth={self.max_depth}, "
+            f"solutions={self.solutions})"
+        )
+
+
+def _propagate(
+    values: list[int],
+    rows: list[int],
+    columns: list[int],
+    blocks: list[int],
+    allowed: list[int],
+) -> int:
+    """
+    places naked and hidden singles until nothing changes.
+
+    returns the index of an empty cell with the fewest possible numbers,
+    `_SOLVED` when all cells have a value or `_CONTRADICTION`.
+    """
+    while True:
+        changed = False
+        best = _SOLVED
+        best_count = 10
+        for index in range(81):
+            if values[index]:
+                continue
+            row, column, block = _ROW[index], _COLUMN[index], _BLOCK[index]
+            mask = allowed[index] & ~(rows[row] | columns[column] | blocks[block])
+            count = POPCOUNT[mask]
+            if count == 1:
+                values[index] = DIGITS[mask][0]
+                rows[row] |= mask
+                columns[column] |= mask
+                blocks[block] |= mask
+                changed = True
+            elif count == 0:
+                return _CONTRADICTION
+            elif count < best_count:
+                best = index
+                best_count = count
+        if changed:
+            continue
+
+        for unit in UNITS:
+            once = 0
+            twice = 0
+            placed = 0
+            for index in unit:
+                if values[index]:
+                    placed |= BIT[values[index]]
+                    continue
+                mask = allowed[index] & ~(
+                    rows[_ROW[index]] | columns[_COLUMN[index]] | blocks[_BLOCK[index]]
+                )
+                twice |= once & mask
+                once |= mask
+            if once | placed != ALL_CANDIDATES:
+                return _CONTRADICTION
+            hidden = once & ~twice
+            if not hidden:
+                continue
+            for index in unit:
+                if values[index]:
+                    continue
+                row, column, block = _ROW[index], _COLUMN[index], _BLOCK[index]
+                mask = (
+                    allowed[index]
+                    & hidden
+                    & ~(rows[row] | columns[column] | blocks[block])
+                )
+                if not mask:
+                    continue
+                if POPCOUNT[mask] > 1:
+                    return _CONTRADICTION
+                values[index] = DIGITS[mask][0]
+                rows[row] |= mask
+                columns[column] |= mask
+                blocks[block] |= mask
+            changed = True
+        if not changed:
+            return best
+
+
+def solutions(
+    field: Field, limit: int | None = None, stats: SearchStats | None = None
+) -> Iterator[list[CellValue]]:
+    """
+    yields every solution of the field as a list of the 81 cell values.
+
+    Stops after `limit` solutions. When `stats` is given, the visited nodes, the
+    depth and the found solutions are counted into it.
+    """
+    if limit is not None and limit <= 0:
+        return
+    values = list(field.grid.values)
+    allowed = list(field.grid.candidates)
+    rows = [0] * 9
+    columns = [0] * 9
+    blocks = [0] * 9
+    for index, value in enumerate(values):
+        if not value:
+            continue
+        bit = BIT[value]
+        row, column, block = _ROW[index], _COLUMN[index], _BLOCK[index]
+        if (rows[row] | columns[column] | blocks[block]) & bit:
+            return
+        rows[row] |= bit
+        columns[column] |= bit
+        blocks[block] |= bit
+
+    found = 0
+    stack = [(values, rows, columns, blocks, 0)]
+    while stack:
+        values, rows, columns, blocks, depth = stack.pop()
+        if stats is not None:
+            stats.nodes += 1
+            stats.max_depth = max(stats.max_depth, depth)
+        index = _propagate(values, rows, columns, blocks, allowed)
+        if index == _CONTRADICTION:
+            continue
+        if index == _SOLVED:
+            if stats is not None:
+                stats.solutions += 1
+            yield values
+            found += 1
+            if limit is not None and found >= limit:
+                return
+            continue
+        row, column, block = _ROW[index], _COLUMN[index], _BLOCK[index]
+        mask = allowed[index] & ~(rows[row] | columns[column] | blocks[block])
+        # pushed in reverse, so the smallest number is tried first
+        for value in reversed(DIGITS[mask]):
+            bit = BIT[value]
+            guess = list(values)
+            guess[index] = value
+            guess_rows = list(rows)
+            guess_rows[row] |= bit
+            guess_columns = list(columns)
+            guess_columns[column] |= bit
+            guess_blocks = list(blocks)
+            guess_blocks[block] |= bit
+            stack.append((guess, guess_rows, guess_columns, guess_blocks, depth + 1))
+
+
+def solve(field: Field, stats: SearchStats | None = None) -> list[CellValue] | None:
+    """
+    returns the first solution of the field, or `None` when there is no solution.
+    """
+    return next(solutions(field, limit=1, stats=stats), None)
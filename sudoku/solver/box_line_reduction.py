@@ -1,28 +1,47 @@
 from collections import defaultdict
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import BIT, DIGITS
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator(group_types=["row", "column"])
 def box_line_reduction(
-    field, *, type: str, idx: int, group: set[Cell]
+    field, *, type: str, idx: int, group: Collection[Cell]
 ) -> Generator[Action]:
     possibilities: defaultdict[int, list[Cell]] = defaultdict(list)
     for member in group:
-        for possible_number in member.hopeful:
+        for possible_number in DIGITS[member.candidates]:
             possibilities[possible_number].append(member)
 
     for single_box_member, members in possibilities.items():
         if len(box := {m.position.block for m in members}) == 1:
             box_id = box.pop()
+            reason = (
+                Reason(
+                    Technique.BOX_LINE_REDUCTION,
+                    "block",
+                    tuple(m.position.as_int() for m in members),
+                    (single_box_member,),
+                )
+                if field.record_reasons
+                else None
+            )
             for member in field.get_group(type="block", idx=box_id):
                 if member in members:
                     continue
-                if single_box_member not in member.hopeful:
+                if not member.candidates & BIT[single_box_member]:
                     continue
                 yield Action(
                     action="remove_possible",
                     value=single_box_member,
                     cell=member,
-                    reason=f"box reduction {single_box_member} only in box {box_id} {list(m.position for m in members)}",
+                    reason=reason,
                 )
@@ -0,0 +1,180 @@
+"""
+Solve a :class:`sudoku.field.Field` as an exact cover problem with Algorithm X and
+dancing links.
+
+Every possible number of every cell is a row of the exact cover matrix. The 324
+columns are the constraints that each cell has a value and that each number
+appears once in each row, column and block. Cells that have a value only get a
+row for this value and empty cells only get rows for their remaining candidates,
+so everything the logical solvers found already prunes the search.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from ..candidates import DIGITS
+from ..field import Field
+from ..types import CellValue
+from ..units import POSITIONS
+
+
+class DancingLinks:
+    """
+    A sparse exact cover matrix as a toroidal doubly linked list, stored in flat lists.
+
+    Node `0` is the root, nodes `1` to `columns` are the column headers.
+    """
+
+    __slots__ = ["column", "down", "left", "right", "row", "size", "up"]
+
+    def __init__(self, columns: int) -> None:
+        headers = columns + 1
+        self.left: list[int] = [headers - 1] + list(range(headers - 1))
+        self.right: list[int] = list(range(1, headers)) + [0]
+        self.up: list[int] = list(range(headers))
+        self.down: list[int] = list(range(headers))
+        self.column: list[int] = list(range(headers))
+        self.row: list[int] = [-1] * headers
+        self.size: list[int] = [0] * headers
+
+    def add_row(self, row: int, columns: Iterable[int]) -> None:
+        """
+        adds a row that covers the given columns, columns are counted from `1`.
+        """
+        first = -1
+        for column in columns:
+            node = len(self.column)
+            self.column.append(column)
+            self.row.append(row)
+            self.up.append(self.up[column])
+            self.down.append(column)
+            self.down[self.up[column]] = node
+            self.up[column] = node
+            self.size[column] += 1
+            if first < 0:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+
+    def cover(self, column: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+        i = down[column]
+        while i != column:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                self.size[self.column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, column: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        i = up[column]
+        while i != column:
+            j = left[i]
+            while j != i:
+                self.size[self.column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[column]] = column
+        left[right[column]] = column
+
+    def search(self) -> Iterator[list[int]]:
+        """
+        yields the rows of every exact cover.
+
+        It always branches on the column with the fewest rows left.
+        """
+        right, down, size = self.right, self.down, self.size
+        selected: list[int] = []
+
+        def search() -> Iterator[list[int]]:
+            if right[0] == 0:
+                yield [self.row[node] for node in selected]
+                return
+            column = right[0]
+            best = column
+            while column != 0:
+                if size[column] < size[best]:
+                    best = column
+                    if size[best] <= 1:
+                        break
+                column = right[column]
+            if size[best] == 0:
+                return
+            self.cover(best)
+            node = down[best]
+            while node != best:
+                selected.append(node)
+                j = right[node]
+                while j != node:
+                    self.cover(self.column[j])
+                    j = right[j]
+                yield from search()
+                j = self.left[node]
+                while j != node:
+                    self.uncover(self.column[j])
+                    j = self.left[j]
+                selected.pop()
+                node = down[node]
+            self.uncover(best)
+
+        return search()
+
+
+def _matrix(field: Field) -> DancingLinks:
+    links = DancingLinks(4 * 81)
+    values = field.grid.values
+    candidates = field.grid.candidates
+    for index in range(81):
+        position = POSITIONS[index]
+        numbers = (values[index],) if values[index] else DIGITS[candidates[index]]
+        for value in numbers:
+            digit = value - 1
+            links.add_row(
+                index * 9 + digit,
+                (
+                    1 + index,
+                    1 + 81 + position.row * 9 + digit,
+                    1 + 162 + position.column * 9 + digit,
+                    1 + 243 + position.block * 9 + digit,
+                ),
+            )
+    return links
+
+
+def solutions(field: Field, limit: int | None = None) -> Iterator[list[CellValue]]:
+    """
+    yields every solution of the field as a list of the 81 cell values.
+
+    Only the current candidates of empty cells are considered, so a field with a
+    wrongly removed candidate might have no solution. Stops after `limit` solutions.
+    """
+    if limit is not None and limit <= 0:
+        return
+    for found, rows in enumerate(_matrix(field).search(), 1):
+        solution = [0] * 81
+        for row in rows:
+            index, digit = divmod(row, 9)
+            solution[index] = digit + 1
+        yield solution
+        if limit is not None and found >= limit:
+            return
+
+
+def solve(field: Field) -> list[CellValue] | None:
+    """
+    returns the first solution of the field, or `None` when there is no solution.
+    """
+    return next(solutions(field, limit=1), None)
@@ -1,13 +1,24 @@
 from collections import defaultdict
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import BIT, DIGITS
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
-def hidden_pairs(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action]:
+def hidden_pairs(
+    field, *, type: str, idx: int, group: Collection[Cell]
+) -> Generator[Action]:
     pairs: defaultdict[int, set[Cell]] = defaultdict(set)
     for member in group:
-        for possible in member.hopeful:
+        for possible in DIGITS[member.candidates]:
             pairs[possible].add(member)
     for key in list(pairs.keys()):
         if len(pairs[key]) > 2:
@@ -22,14 +33,24 @@ def hidden_pairs(field, *, type: str, idx: int, group: set[Cell]) -> Generator[A
                     possible_hidden_pairs.index(other_possible_pair)
                 )
 
+                reason = (
+                    Reason(
+                        Technique.HIDDEN_PAIR,
+                        type,
+                        tuple(e.position.as_int() for e in pairs[possible_hidden_pair]),
+                        (possible_hidden_pair, other_possible_pair),
+                    )
+                    if field.record_reasons
+                    else None
+                )
                 for cell_to_clean in pairs[possible_hidden_pair]:
-                    for number_to_clean in cell_to_clean.hopeful - {
-                        possible_hidden_pair,
-                        other_possible_pair,
-                    }:
+                    for number_to_clean in DIGITS[
+                        cell_to_clean.candidates
+                        & ~(BIT[possible_hidden_pair] | BIT[other_possible_pair])
+                    ]:
                         yield Action(
                             action="remove_possible",
                             value=number_to_clean,
                             cell=cell_to_clean,
-                            reason=f"hidden pair in same {type} { {possible_hidden_pair, other_possible_pair}!r} on {list(e.position for e in pairs[possible_hidden_pair])}",
+                            reason=reason,
                         )
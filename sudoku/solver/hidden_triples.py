@@ -1,16 +1,25 @@
 from collections import defaultdict
 from itertools import combinations
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import DIGITS, mask_of
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
 def hidden_triples(
-    field, *, type: str, idx: int, group: set[Cell]
+    field, *, type: str, idx: int, group: Collection[Cell]
 ) -> Generator[Action]:
     tripples: defaultdict[int, set[Cell]] = defaultdict(set)
     for member in group:
-        for possible in member.hopeful:
+        for possible in DIGITS[member.candidates]:
             tripples[possible].add(member)
     for key in list(tripples.keys()):
         if len(tripples[key]) > 3:
@@ -23,11 +32,22 @@ def hidden_triples(
         if len(cells_of_triplet) > 3:
             continue
 
+        tripple_mask = mask_of(possible_hidden_tripple)
+        reason = (
+            Reason(
+                Technique.HIDDEN_TRIPLE,
+                type,
+                tuple(e.position.as_int() for e in cells_of_triplet),
+                possible_hidden_tripple,
+            )
+            if field.record_reasons
+            else None
+        )
         for cell_to_clean in cells_of_triplet:
-            for number_to_clean in cell_to_clean.hopeful - set(possible_hidden_tripple):
+            for number_to_clean in DIGITS[cell_to_clean.candidates & ~tripple_mask]:
                 yield Action(
                     action="remove_possible",
                     value=number_to_clean,
                     cell=cell_to_clean,
-                    reason=f"hidden tripple in same {type} { {possible_hidden_tripple}!r} on {list(e.position for e in cells_of_triplet)}",
+                    reason=reason,
                 )
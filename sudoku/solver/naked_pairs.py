@@ -1,25 +1,46 @@
 from collections import defaultdict
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import BIT, DIGITS, POPCOUNT
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
-def naked_pairs(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action]:
+def naked_pairs(
+    field, *, type: str, idx: int, group: Collection[Cell]
+) -> Generator[Action]:
     pairs: defaultdict[tuple[int, ...], list[Cell]] = defaultdict(list)
     for member in group:
-        if len(member.hopeful) == 2:
-            pairs[tuple(sorted(member.hopeful))].append(member)
+        if POPCOUNT[member.candidates] == 2:
+            pairs[DIGITS[member.candidates]].append(member)
     for to_be_removed_tuple, except_members in pairs.items():
         if len(except_members) != 2:
             continue
+        reason = (
+            Reason(
+                Technique.NAKED_PAIR,
+                type,
+                tuple(e.position.as_int() for e in except_members),
+                to_be_removed_tuple,
+            )
+            if field.record_reasons
+            else None
+        )
         for member in group:
             if member in except_members:
                 continue
             for to_be_removed in to_be_removed_tuple:
-                if to_be_removed in member.hopeful:
+                if member.candidates & BIT[to_be_removed]:
                     yield Action(
                         action="remove_possible",
                         value=to_be_removed,
                         cell=member,
-                        reason=f"naked pair in same {type} {to_be_removed_tuple!r} on {list(e.position for e in except_members)}",
+                        reason=reason,
                     )
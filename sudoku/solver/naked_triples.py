@@ -1,29 +1,51 @@
 from collections import defaultdict
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import ALL_CANDIDATES, BIT, DIGITS, POPCOUNT
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
-def naked_triples(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action]:
+def naked_triples(
+    field, *, type: str, idx: int, group: Collection[Cell]
+) -> Generator[Action]:
     triples: defaultdict[tuple[int, ...], list[Cell]] = defaultdict(list)
     for member in group:
-        if len(member.hopeful) == 3:
-            triples[tuple(sorted(member.hopeful))].append(member)
-        if len(member.hopeful) == 2:
-            for missing_value in {1, 2, 3, 4, 5, 6, 7, 8} - member.hopeful:
-                triples[tuple(sorted(member.hopeful | {missing_value}))].append(member)
+        mask = member.candidates
+        if POPCOUNT[mask] == 3:
+            triples[DIGITS[mask]].append(member)
+        if POPCOUNT[mask] == 2:
+            for missing_value in DIGITS[ALL_CANDIDATES & ~mask]:
+                triples[DIGITS[mask | BIT[missing_value]]].append(member)
 
     for to_be_removed_tuple, except_members in triples.items():
         if len(except_members) != 3:
             continue
+        reason = (
+            Reason(
+                Technique.NAKED_TRIPLE,
+                type,
+                tuple(e.position.as_int() for e in except_members),
+                to_be_removed_tuple,
+            )
+            if field.record_reasons
+            else None
+        )
         for member in group:
             if member in except_members:
                 continue
             for to_be_removed in to_be_removed_tuple:
-                if to_be_removed in member.hopeful:
+                if member.candidates & BIT[to_be_removed]:
                     yield Action(
                         action="remove_possible",
                         value=to_be_removed,
                         cell=member,
-                        reason=f"naked triple in same {type} {to_be_removed_tuple!r} on {list(e.position for e in except_members)}",
+                        reason=reason,
                     )
@@ -1,9 +1,18 @@
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import BIT
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
 def show_possibles(
-    field, *, type: str, idx: int, group: set[Cell]
+    field, *, type: str, idx: int, group: Collection[Cell]
 ) -> Generator[Action]:
     """
     Show impossible values for cells in a given group (row, column, or box) and yield actions to remove them.
@@ -14,10 +23,17 @@ def show_possibles(
         for other_member in group:
             if member == other_member:
                 continue
-            if member.value in other_member.hopeful:
+            if other_member.candidates & BIT[member.value]:
                 yield Action(
                     action="remove_possible",
                     value=member.value,
                     cell=other_member,
-                    reason=f"value {member.value} is present in the same {type} at {member.position}",
+                    reason=Reason(
+                        Technique.SHOW_POSSIBLES,
+                        type,
+                        (member.position.as_int(),),
+                        (member.value,),
+                    )
+                    if field.record_reasons
+                    else None,
                 )
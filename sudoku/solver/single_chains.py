@@ -1,5 +1,6 @@
+from ..candidates import BIT
 from ..chain import Chain
-from .utils import Action, Cell, Generator, check_generator
+from .utils import Action, Cell, Generator, Reason, Technique, check_generator
 
 
 @check_generator()
@@ -11,14 +12,13 @@ def single_chains(field, check: int) -> Generator[Action]:
             possible_cells = [
                 cell
                 for cell in field.get_group(type=group, idx=idx)
-                if check in cell.hopeful
+                if cell.candidates & BIT[check]
             ]
             if len(possible_cells) != 2:
                 continue
             chains.add_pair(*possible_cells)
 
-    possible_cells = {cell for cell in field.cells if check in cell.hopeful}
-    print(chains.subchains)
+    possible_cells = {cell for cell in field.cells if cell.candidates & BIT[check]}
     for chain in chains.subchains:
         for cell in possible_cells - chain.members:
             colors_seen = {
@@ -29,7 +29,17 @@ def single_chains(field, check: int) -> Generator[Action]:
                     action="remove_possible",
                     value=check,
                     cell=cell,
-                    reason=f"single chain rule 4: {cell} sees multiple colors of chain {chain}",
+                    reason=Reason(
+                        Technique.SINGLE_CHAIN,
+                        "",
+                        (
+                            cell.position.as_int(),
+                            *(m.position.as_int() for m in chain.members),
+                        ),
+                        (check,),
+                    )
+                    if field.record_reasons
+                    else None,
                 )
                 # TODO: should we check if it is part of a chain and use this knowledge to solve other cells already?
 
@@ -1,13 +1,24 @@
 from collections import defaultdict
 
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import DIGITS
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
-def singles(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action]:
+def singles(
+    field, *, type: str, idx: int, group: Collection[Cell]
+) -> Generator[Action]:
     possibilities: defaultdict[int, list[Cell]] = defaultdict(list)
     for member in group:
-        for possible_number in member.hopeful:
+        for possible_number in DIGITS[member.candidates]:
             possibilities[possible_number].append(member)
     for single, members in possibilities.items():
         if len(members) > 1:
@@ -16,5 +27,9 @@ def singles(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action
             action="set_number",
             value=single,
             cell=members[0],
-            reason=f"single {single} found in {type} at {members[0].position}",
+            reason=Reason(
+                Technique.SINGLE, type, (members[0].position.as_int(),), (single,)
+            )
+            if field.record_reasons
+            else None,
         )
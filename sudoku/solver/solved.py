@@ -1,14 +1,27 @@
-from .utils import Action, Cell, Generator, group_generator
+from ..candidates import DIGITS, POPCOUNT
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    group_generator,
+)
 
 
 @group_generator()
-def solved(field, *, type: str, idx: int, group: set[Cell]) -> Generator[Action]:
+def solved(field, *, type: str, idx: int, group: Collection[Cell]) -> Generator[Action]:
     for member in group:
-        if len(member.hopeful) == 1:
-            value = list(member.hopeful)[0]
+        if POPCOUNT[member.candidates] == 1:
+            value = DIGITS[member.candidates][0]
             yield Action(
                 action="set_number",
                 value=value,
                 cell=member,
-                reason=f"solved cell {value} found at {member.position}",
+                reason=Reason(
+                    Technique.SOLVED, type, (member.position.as_int(),), (value,)
+                )
+                if field.record_reasons
+                else None,
             )
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable, Iterator
+from time import perf_counter
+from typing import Any, Self
+
+
+class UnitStats:
+    """
+    The statistics of one solver for one unit type.
+
+    `seconds` is the time spent inside the solver, without the time of the caller.
+
+    `groups` is the number of groups the solver looked at.
+
+    `yielded` is the number of actions the solver yielded.
+
+    `changed` is the number of those actions that actually changed the field.
+    """
+
+    __slots__ = ["changed", "groups", "seconds", "yielded"]
+
+    def __init__(self) -> None:
+        self.seconds: float = 0.0
+        self.groups: int = 0
+        self.yielded: int = 0
+        self.changed: int = 0
+
+    def __iadd__(self, other: UnitStats) -> Self:
+        self.seconds += other.seconds
+        self.groups += other.groups
+        self.yielded += other.yielded
+        self.changed += other.changed
+        return self
+
+    @property
+    def redundant(self) -> int:
+        """
+        the number of yielded actions that did not change the field.
+        """
+        return self.yielded - self.changed
+
+    def __repr__(self) -> str:
+        return (
+            f"UnitStats(seconds={self.seconds:.6f}, groups={self.groups}, "
+            f"yielded={self.yielded}, changed={self.changed})"
+        )
+
+
+class SolverStats:
+    """
+    Collects :class:`UnitStats` per solver and unit type.
+
+    Pass it as `stats` keyword argument to a solver to enable the instrumentation
+    of the solver decorators, or to :func:`sudoku.engine.solve` to collect it for
+    a whole solve. Solvers called without `stats` are not instrumented at all.
+
+    The decorators only know which actions were yielded, whoever applies them has
+    to report which of them changed the field with :meth:`record_changed`.
+    """
+
+    __slots__ = ["_pending", "units"]
+
+    def __init__(self) -> None:
+        self.units: dict[tuple[str, str], UnitStats] = {}
+        self._pending: list[UnitStats] = []
+
+    def unit(self, solver: str, type: str) -> UnitStats:
+        """
+        returns the statistics of `solver` for the unit type `type`.
+        """
+        key = (solver, type)
+        if key not in self.units:
+            self.units[key] = UnitStats()
+        return self.units[key]
+
+    def record_changed(self, changed: Iterable[bool]) -> None:
+        """
+        records for each action yielded since the last call, if it changed the field.
+        """
+        for unit, has_changed in zip(self._pending, changed):
+            unit.changed += has_changed
+        self._pending.clear()
+
+    def per_solver(self) -> dict[str, UnitStats]:
+        """
+        returns the statistics summed over all unit types of a solver.
+        """
+        solvers: dict[str, UnitStats] = {}
+        for (solver, _), unit in self.units.items():
+            solvers.setdefault(solver, UnitStats())
+            solvers[solver] += unit
+        return solvers
+
+    def instrument(
+        self, solver: str, type: str, actions: Iterator[Any], groups: int = 1
+    ) -> Generator[Any]:
+        """
+        yields all `actions` while recording the statistics of `solver` for `type`.
+        """
+        unit = self.unit(solver, type)
+        unit.groups += groups
+        start = perf_counter()
+        for action in actions:
+            unit.seconds += perf_counter() - start
+            unit.yielded += 1
+            self._pending.append(unit)
+            yield action
+            start = perf_counter()
+        unit.seconds += perf_counter() - start
+
+    def __str__(self) -> str:
+        lines = [
+            (
+                f"{'solver':<20} {'type':<8} {'seconds':>10} {'groups':>8} "
+                f"{'yielded':>8} {'changed':>8}"
+            )
+        ]
+        for (solver, type), unit in sorted(self.units.items()):
+            lines.append(
+                f"{solver:<20} {type:<8} {unit.seconds:>10.6f} {unit.groups:>8} "
+                f"{unit.yielded:>8} {unit.changed:>8}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,43 @@
+"""
+Count the solutions of a :class:`sudoku.field.Field`, to tell if a puzzle is valid.
+
+A valid puzzle has exactly one solution. The counting stops as soon as the limit is
+reached, so telling one from many solutions only needs to find a second solution.
+The search honours the current candidates of the field, running the logical solvers
+first makes it prune earlier.
+"""
+
+from __future__ import annotations
+
+import enum
+
+from ..field import Field
+from .backtracking import solutions
+
+
+class Uniqueness(enum.Enum):
+    NO_SOLUTION = enum.auto()
+    UNIQUE = enum.auto()
+    MULTIPLE_SOLUTIONS = enum.auto()
+
+
+def count_solutions(field: Field, limit: int | None = 2) -> int:
+    """
+    returns the number of solutions of the field, but at most `limit`.
+
+    Without a limit all solutions are counted, which can take very long for
+    fields with only a few values.
+    """
+    return sum(1 for _ in solutions(field, limit=limit))
+
+
+def uniqueness(field: Field) -> Uniqueness:
+    """
+    returns if the field has no, exactly one or multiple solutions.
+    """
+    count = count_solutions(field, limit=2)
+    if count == 0:
+        return Uniqueness.NO_SOLUTION
+    if count == 1:
+        return Uniqueness.UNIQUE
+    return Uniqueness.MULTIPLE_SOLUTIONS
@@ -1,13 +1,31 @@
-import random
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Collection, Generator
+from random import Random
 from typing import Any, cast
 
 import wrapt
 
+from sudoku.action import Action
+from sudoku.cell import Cell
 from sudoku.field import Field
+from sudoku.reason import Reason, Technique
+from sudoku.units import unit_id
 
+from .stats import SolverStats
 
-def check_generator(checks: range = range(9)) -> Callable[..., Any]:
+__all__ = [
+    "Action",
+    "Cell",
+    "Collection",
+    "Generator",
+    "Reason",
+    "Technique",
+    "check_generator",
+    "group_generator",
+    "multi_group_generator",
+]
+
+
+def check_generator(checks: range = range(1, 10)) -> Callable[..., Any]:
     @wrapt.decorator
     def my_decorator(
         wrapped: Callable[..., Generator[Any]],
@@ -16,8 +34,24 @@ def check_generator(checks: range = range(9)) -> Callable[..., Any]:
         kwargs: dict[str, Any],
     ) -> Generator[Any]:
         field = args[0]
-        for check in checks:
-            yield from wrapped(field, check=check)
+        stats: SolverStats | None = kwargs.pop("stats", None)
+        since: int | None = kwargs.pop("since", None)
+        rng: Random | None = kwargs.pop("rng", None)
+        if since is not None and field.grid.generation <= since:
+            return
+        local_checks: Collection[int] = checks
+        if rng is not None:
+            local_checks = list(checks)
+            rng.shuffle(local_checks)
+        for check in local_checks:
+            if stats is None:
+                yield from wrapped(field, check=check)
+            else:
+                yield from stats.instrument(
+                    getattr(wrapped, "__name__", repr(wrapped)),
+                    "digit",
+                    wrapped(field, check=check),
+                )
 
     return cast(Callable[..., Generator], my_decorator)
 
@@ -37,11 +71,29 @@ def multi_group_generator(
     ) -> Generator[Any]:
         local_group_types = group_types
         field = args[0]
-        random.shuffle(local_group_types)
+        stats: SolverStats | None = kwargs.pop("stats", None)
+        since: int | None = kwargs.pop("since", None)
+        rng: Random | None = kwargs.pop("rng", None)
+        if rng is not None:
+            local_group_types = list(local_group_types)
+            rng.shuffle(local_group_types)
 
         for type in local_group_types:
+            if since is not None and all(
+                field.grid.unit_generations[unit_id(type[:-1], idx)] <= since
+                for idx in range(9)
+            ):
+                continue
             groups = [field.get_group(type[:-1], idx) for idx in range(9)]
-            yield from wrapped(field, type=type, groups=groups, **kwargs)
+            if stats is None:
+                yield from wrapped(field, type=type, groups=groups, **kwargs)
+            else:
+                yield from stats.instrument(
+                    getattr(wrapped, "__name__", repr(wrapped)),
+                    type,
+                    wrapped(field, type=type, groups=groups, **kwargs),
+                    groups=len(groups),
+                )
 
     return cast(Callable[..., Generator], my_decorator)
 
@@ -49,6 +101,19 @@ def multi_group_generator(
 def group_generator(
     group_types: list[str] | None = None, indices: list[int] | None = None
 ) -> Callable[..., Any]:
+    """
+    calls the decorated solver for each group of the field.
+
+    The decorated solver accepts these keyword arguments:
+     - `group_types` / `group_type` and `indices` / `idx` limit the visited groups
+     - `type`, `idx` and `group` run the solver on a single given group
+     - `stats` a :class:`sudoku.solver.stats.SolverStats` to record statistics into
+     - `since` a generation of the grid, groups that did not change since are skipped
+     - `rng` a :class:`random.Random` to visit the groups in a random order
+
+    Without `rng` the groups are visited in the given order, by default all rows,
+    then all columns and then all blocks, so a solve is reproducible.
+    """
     if group_types is None:
         group_types = ["row", "column", "block"]
     if indices is None:
@@ -64,14 +129,23 @@ def group_generator(
         local_group_types = group_types
         local_indices = indices
         field = args[0]
+        stats: SolverStats | None = kwargs.pop("stats", None)
+        since: int | None = kwargs.pop("since", None)
+        rng: Random | None = kwargs.pop("rng", None)
 
         if "group" in kwargs:
-            yield from wrapped(
+            actions = wrapped(
                 field,
                 type=kwargs.get("type"),
                 idx=kwargs.get("idx"),
                 group=kwargs.get("group"),
             )
+            if stats is None:
+                yield from actions
+            else:
+                yield from stats.instrument(
+                    getattr(wrapped, "__name__", repr(wrapped)), kwargs["type"], actions
+                )
             return
         if "group_types" in kwargs:
             local_group_types = list(kwargs.pop("group_types"))
@@ -83,12 +157,28 @@ def group_generator(
         elif "idx" in kwargs:
             local_indices = [kwargs.pop("idx")]
 
-        random.shuffle(local_group_types)
-        random.shuffle(local_indices)
+        if rng is not None:
+            # never shuffle the defaults of the decorator in place
+            local_group_types = list(local_group_types)
+            local_indices = list(local_indices)
+            rng.shuffle(local_group_types)
+            rng.shuffle(local_indices)
 
         for type in local_group_types:
             for idx in local_indices:
+                if (
+                    since is not None
+                    and field.grid.unit_generations[unit_id(type, idx)] <= since
+                ):
+                    continue
                 group = field.get_group(type, idx)
-                yield from wrapped(field, type=type, idx=idx, group=group, **kwargs)
+                if stats is None:
+                    yield from wrapped(field, type=type, idx=idx, group=group, **kwargs)
+                else:
+                    yield from stats.instrument(
+                        getattr(wrapped, "__name__", repr(wrapped)),
+                        type,
+                        wrapped(field, type=type, idx=idx, group=group, **kwargs),
+                    )
 
     return cast(Callable[..., Generator], my_decorator)
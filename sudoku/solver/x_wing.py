@@ -1,11 +1,20 @@
 from collections import defaultdict
 
+from ..candidates import BIT, DIGITS
 from ..types import CellValue
-from .utils import Action, Cell, Generator, multi_group_generator
+from .utils import (
+    Action,
+    Cell,
+    Collection,
+    Generator,
+    Reason,
+    Technique,
+    multi_group_generator,
+)
 
 
 @multi_group_generator()
-def x_wing(field, *, type: str, groups: list[set[Cell]]) -> Generator[Action]:
+def x_wing(field, *, type: str, groups: list[Collection[Cell]]) -> Generator[Action]:
     def decide_x_or_y(type: str) -> str:
         match type:
             case "rows":
@@ -31,12 +40,12 @@ def x_wing(field, *, type: str, groups: list[set[Cell]]) -> Generator[Action]:
     x_or_y = decide_x_or_y(type)
     for group_idx, group in enumerate(groups):
         for member in group:
-            for possible_number in member.hopeful:
+            for possible_number in DIGITS[member.candidates]:
                 sorted_tuple = tuple(
                     sorted(
                         getattr(m.position, x_or_y)
                         for m in group
-                        if possible_number in m.hopeful
+                        if m.candidates & BIT[possible_number]
                     )
                 )
                 # print(f"{possible_number} {sorted_tuple}")
@@ -53,8 +62,21 @@ def x_wing(field, *, type: str, groups: list[set[Cell]]) -> Generator[Action]:
                 ]:
                     # case [[col_a,col_b], [row_a,row_b]]:
                     # print(f"{type} solution for {possible_number} found")
-                    x_wing_id = f"{col_a},{row_a} {col_a},{row_b} {col_b},{row_a} {col_b},{row_b}"
-                    # print(x_wing_id)
+                    reason = (
+                        Reason(
+                            Technique.X_WING,
+                            opposite_group(type),
+                            (
+                                col_a + 9 * row_a,
+                                col_a + 9 * row_b,
+                                col_b + 9 * row_a,
+                                col_b + 9 * row_b,
+                            ),
+                            (possible_number,),
+                        )
+                        if field.record_reasons
+                        else None
+                    )
                     good_points = sum(cell_lookup.values(), start=[])
                     for bar_idx in possibility_tuple:
                         for cell in field.get_group(
@@ -62,12 +84,12 @@ def x_wing(field, *, type: str, groups: list[set[Cell]]) -> Generator[Action]:
                         ):
                             if cell in good_points:
                                 continue
-                            if possible_number in cell.hopeful:
+                            if cell.candidates & BIT[possible_number]:
                                 yield Action(
                                     action="remove_possible",
                                     value=possible_number,
                                     cell=cell,
-                                    reason=f"X-Wing {x_wing_id}, {possible_number} cannot occur in other cell in this {opposite_group(type)}",
+                                    reason=reason,
                                 )
 
     yield from ()
@@ -0,0 +1,69 @@
+"""
+Precomputed index tables for the 27 units (rows, columns and blocks) of a field.
+
+All tables contain cell indices as returned by
+:meth:`sudoku.types.CellPosition.as_int` and are sorted, so iterating them
+always visits the cells in the same order.
+
+Unit ids are `0` to `8` for the rows, `9` to `17` for the columns and `18` to
+`26` for the blocks.
+"""
+
+from __future__ import annotations
+
+from .types import CellPosition
+
+GROUP_TYPES: tuple[str, ...] = ("row", "column", "block")
+
+_GROUP_OFFSET: dict[str, int] = {
+    group_type: offset * 9 for offset, group_type in enumerate(GROUP_TYPES)
+}
+
+POSITIONS: tuple[CellPosition, ...] = tuple(
+    CellPosition.from_int(index) for index in range(81)
+)
+"""
+`POSITIONS[index]` is the :class:`sudoku.types.CellPosition` of the cell `index`.
+"""
+
+CELL_UNITS: tuple[tuple[int, int, int], ...] = tuple(
+    (position.row, 9 + position.column, 18 + position.block) for position in POSITIONS
+)
+"""
+`CELL_UNITS[index]` are the ids of the row, column and block of the cell `index`.
+"""
+
+UNITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(index for index in range(81) if unit in CELL_UNITS[index])
+    for unit in range(27)
+)
+"""
+`UNITS[unit]` are the indices of the nine cells of a unit.
+"""
+
+PEERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sorted({peer for unit in CELL_UNITS[index] for peer in UNITS[unit]} - {index})
+    )
+    for index in range(81)
+)
+"""
+`PEERS[index]` are the indices of the 20 cells that share a unit with the cell `index`.
+"""
+
+
+def unit_id(type: str, idx: int) -> int:
+    """
+    returns the unit id of a group.
+
+    `type` is either a `row`, `column`, or `block`
+    `idx` is the index of the group regarding to the :class:`sudoku.types.CellPosition`
+    """
+    return _GROUP_OFFSET[type] + idx
+
+
+def unit_type(unit: int) -> str:
+    """
+    returns the group type (`row`, `column`, or `block`) of a unit id.
+    """
+    return GROUP_TYPES[unit // 9]
@@ -0,0 +1,229 @@
+"""
+Apply the basic techniques to many puzzles at once with NumPy.
+
+A batch of N puzzles is an `(N, 81)` array of values and an `(N, 81, 9)` boolean
+array of candidates, where `candidates[n, index, value - 1]` tells if `value` is
+still possible for the cell `index` of puzzle `n`. Every round applies
+`show_possibles`, `solved`, `singles`, `pointing_pairs` and `box_line_reduction`
+to all unfinished puzzles with array operations over the index tables of
+:mod:`sudoku.units`.
+
+Solved puzzles and puzzles with a contradiction drop out of the batch. Puzzles
+the basic techniques can't finish are handed over to :func:`sudoku.engine.solve`
+with their current candidates, so the result is the same as solving every puzzle
+on its own.
+
+NumPy is an optional dependency, install it with the `numpy` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "sudoku.vectorized needs numpy, install it with the `numpy` extra"
+    ) from e
+
+from .engine import SolveStatus
+from .engine import solve as solve_field
+from .field import Field
+from .units import PEERS, POSITIONS, UNITS
+
+_UNITS = np.array(UNITS, dtype=np.intp)
+_PEERS = np.array(PEERS, dtype=np.intp)
+_DIGIT_BITS = np.array([1 << digit for digit in range(9)], dtype=np.uint16)
+
+
+def _segments(line_of: str, box_of: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    returns the index tables for the intersections of the lines and the blocks.
+
+    A segment are the three cells a row (or column) shares with a block, segment
+    `3 * line + box` is the part of `line` in its `box`-th block.
+
+    The second table contains for each cell the two other segments of its line,
+    the third table the two other segments of its block.
+    """
+    segments = np.zeros((27, 3), dtype=np.intp)
+    filled = [0] * 27
+    for index, position in enumerate(POSITIONS):
+        segment = 3 * getattr(position, line_of) + getattr(position, box_of) // 3
+        segments[segment, filled[segment]] = index
+        filled[segment] += 1
+    line_others = np.zeros((81, 2), dtype=np.intp)
+    box_others = np.zeros((81, 2), dtype=np.intp)
+    for index, position in enumerate(POSITIONS):
+        line = getattr(position, line_of)
+        box = getattr(position, box_of) // 3
+        line_others[index] = [3 * line + other for other in range(3) if other != box]
+        first = line - line % 3
+        box_others[index] = [
+            3 * other + box for other in range(first, first + 3) if other != line
+        ]
+    return segments, line_others, box_others
+
+
+_ROW_SEGMENTS = _segments("row", "column")
+_COLUMN_SEGMENTS = _segments("column", "row")
+
+
+class Solution(NamedTuple):
+    """
+    `solution` contains the values of all 81 cells, `0` for cells that were not solved.
+
+    `status` tells if the puzzle was solved, got stuck or contains a contradiction.
+
+    `vectorized` is `False` when the puzzle was finished by :func:`sudoku.engine.solve`.
+    """
+
+    solution: str
+    status: SolveStatus
+    vectorized: bool
+
+
+def to_arrays(fields: Iterable[Field]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns the values and candidates of the fields as arrays.
+    """
+    grids = [field.grid for field in fields]
+    values = np.array([grid.values for grid in grids], dtype=np.uint8).reshape(-1, 81)
+    masks = np.array([grid.candidates for grid in grids], dtype=np.uint16)
+    candidates = (masks.reshape(-1, 81, 1) & _DIGIT_BITS) != 0
+    return values, candidates
+
+
+def to_field(values: np.ndarray, candidates: np.ndarray) -> Field:
+    """
+    returns a field with the values and candidates of a single puzzle.
+    """
+    masks = (candidates.astype(np.uint16) * _DIGIT_BITS).sum(axis=-1)
+    return Field.from_masks(values.tolist(), masks.tolist())
+
+
+def _line_box(
+    candidates: np.ndarray,
+    tables: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> np.ndarray:
+    """
+    returns the eliminations of pointing pairs and box line reduction for one
+    line type.
+    """
+    segments, line_others, box_others = tables
+    count = len(candidates)
+    # (N, 27, 9): a value is possible somewhere in the segment
+    present = candidates[:, segments].any(axis=2)
+    by_line = present.reshape(count, 9, 3, 9)
+    by_box = present.reshape(count, 3, 3, 3, 9)
+    # only one segment of a block has the value: remove it from the rest of the line
+    pointing = by_box & (by_box.sum(axis=2, keepdims=True) == 1)
+    # only one segment of a line has the value: remove it from the rest of the block
+    box_line = by_line & (by_line.sum(axis=2, keepdims=True) == 1)
+    pointing = pointing.reshape(count, 27, 9)
+    box_line = box_line.reshape(count, 27, 9)
+    return pointing[:, line_others].any(axis=2) | box_line[:, box_others].any(axis=2)
+
+
+def _contradictions(values: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    returns for each puzzle if it contains a contradiction,
+    see :func:`sudoku.engine.is_contradiction`.
+    """
+    placed = values[..., None] == np.arange(1, 10, dtype=np.uint8)
+    empty = (values == 0) & ~candidates.any(axis=-1)
+    twice = placed[:, _UNITS].sum(axis=2) > 1
+    missing = ~(placed | candidates)[:, _UNITS].any(axis=2)
+    return empty.any(axis=1) | twice.any(axis=(1, 2)) | missing.any(axis=(1, 2))
+
+
+def _round(values: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    applies one round of all techniques to the puzzles in place.
+
+    returns for each puzzle if it changed.
+    """
+    before = candidates.copy()
+
+    # show_possibles
+    placed = values[..., None] == np.arange(1, 10, dtype=np.uint8)
+    candidates &= ~placed[:, _PEERS].any(axis=2)
+    candidates[values != 0] = False
+
+    # solved
+    possible = candidates.sum(axis=-1)
+    naked = (values == 0) & (possible == 1)
+    update = np.where(naked, candidates.argmax(axis=-1) + 1, 0).astype(np.uint8)
+
+    # singles
+    in_unit = candidates[:, _UNITS]
+    hidden = in_unit.sum(axis=2) == 1
+    puzzle, unit, digit = np.nonzero(hidden)
+    cell = _UNITS[unit, in_unit[puzzle, unit, :, digit].argmax(axis=-1)]
+    update[puzzle, cell] = digit + 1
+
+    set_any = (update != 0).any(axis=1)
+    values[update != 0] = update[update != 0]
+    candidates[update != 0] = False
+
+    # pointing_pairs and box_line_reduction, only when no value was set
+    rest = ~set_any
+    if rest.any():
+        remaining = candidates[rest]
+        remaining &= ~_line_box(remaining, _ROW_SEGMENTS)
+        remaining &= ~_line_box(remaining, _COLUMN_SEGMENTS)
+        candidates[rest] = remaining
+    return set_any | (candidates != before).any(axis=(1, 2))
+
+
+def solve(puzzles: Iterable[str | Field], fallback: bool = False) -> list[Solution]:
+    """
+    solves all puzzles and returns the results in input order.
+
+    Puzzles can be given as strings, in the format accepted by
+    :class:`sudoku.field.Field`, or as fields. Fields are not changed.
+
+    See :func:`sudoku.engine.solve` for `fallback`, it only applies to the
+    puzzles that are handed over to the regular solvers.
+    """
+    fields = [
+        puzzle if isinstance(puzzle, Field) else Field(puzzle) for puzzle in puzzles
+    ]
+    values, candidates = to_arrays(fields)
+    results: dict[int, Solution] = {}
+
+    active = np.arange(len(fields))
+    while len(active):
+        current_values = values[active]
+        current_candidates = candidates[active]
+        contradiction = _contradictions(current_values, current_candidates)
+        solved = ~contradiction & (current_values != 0).all(axis=1)
+        for index in active[contradiction]:
+            results[index] = _solution(values[index], SolveStatus.CONTRADICTION)
+        for index in active[solved]:
+            results[index] = _solution(values[index], SolveStatus.SOLVED)
+        rest = ~contradiction & ~solved
+        active = active[rest]
+        current_values = current_values[rest]
+        current_candidates = current_candidates[rest]
+        if not len(active):
+            break
+
+        changed = _round(current_values, current_candidates)
+        # the round worked on copies, write them back
+        values[active] = current_values
+        candidates[active] = current_candidates
+        for index in active[~changed]:
+            field = to_field(values[index], candidates[index])
+            result = solve_field(field, fallback=fallback)
+            results[index] = Solution(
+                "".join(map(str, field.grid.values)), result.status, False
+            )
+        active = active[changed]
+    return [results[index] for index in range(len(fields))]
+
+
+def _solution(values: np.ndarray, status: SolveStatus) -> Solution:
+    return Solution("".join(map(str, values.tolist())), status, True)
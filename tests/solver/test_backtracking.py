@@ -0,0 +1,48 @@
+from sudoku.candidates import BIT
+from sudoku.field import Field
+from sudoku.solver import backtracking
+from sudoku.units import UNITS
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+SOLUTION = (
+    "812753649943682175675491283154237896369845721287169534521974368438526917796318452"
+)
+
+
+def is_valid(solution: list[int]) -> bool:
+    return all(
+        sorted(solution[index] for index in unit) == list(range(1, 10))
+        for unit in UNITS
+    )
+
+
+def test_solve() -> None:
+    stats = backtracking.SearchStats()
+    solution = backtracking.solve(Field(HARD), stats)
+    assert solution is not None
+    assert "".join(map(str, solution)) == SOLUTION
+    assert stats.solutions == 1
+    assert stats.nodes > 1
+    assert stats.max_depth > 0
+
+
+def test_solutions_limit() -> None:
+    stats = backtracking.SearchStats()
+    solutions = list(backtracking.solutions(Field(""), limit=5, stats=stats))
+    assert len(solutions) == 5
+    assert all(is_valid(solution) for solution in solutions)
+    assert len({tuple(solution) for solution in solutions}) == 5
+    assert stats.solutions == 5
+
+
+def test_honours_candidates() -> None:
+    field = Field(HARD)
+    field.cells[1].candidates &= ~BIT[1]
+    assert backtracking.solve(field) is None
+
+
+def test_no_solution() -> None:
+    assert backtracking.solve(Field("11")) is None
+    assert backtracking.solve(Field("12345678" + "0" * 9 + "9")) is None
@@ -0,0 +1,43 @@
+from sudoku.candidates import BIT
+from sudoku.field import Field
+from sudoku.solver import exact_cover
+from sudoku.units import UNITS
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+SOLUTION = (
+    "812753649943682175675491283154237896369845721287169534521974368438526917796318452"
+)
+
+
+def is_valid(solution: list[int]) -> bool:
+    return all(
+        sorted(solution[index] for index in unit) == list(range(1, 10))
+        for unit in UNITS
+    )
+
+
+def test_solve() -> None:
+    solution = exact_cover.solve(Field(HARD))
+    assert solution is not None
+    assert "".join(map(str, solution)) == SOLUTION
+    assert is_valid(solution)
+
+
+def test_solutions_limit() -> None:
+    solutions = list(exact_cover.solutions(Field(""), limit=3))
+    assert len(solutions) == 3
+    assert all(is_valid(solution) for solution in solutions)
+    assert len({tuple(solution) for solution in solutions}) == 3
+
+
+def test_honours_candidates() -> None:
+    field = Field(HARD)
+    # the second cell has to be a 1, without it there is no solution
+    field.cells[1].candidates &= ~BIT[1]
+    assert exact_cover.solve(field) is None
+
+
+def test_no_solution() -> None:
+    assert exact_cover.solve(Field("11")) is None
@@ -3,6 +3,7 @@ from typing import NamedTuple
 import pytest
 
 from sudoku.action import Action
+from sudoku.candidates import mask_of
 from sudoku.cell import Cell
 from sudoku.field import Field
 from sudoku.solver.naked_pairs import naked_pairs
@@ -19,6 +20,10 @@ class MockCell(NamedTuple):
     def __hash__(self) -> int:
         return self.position.as_int()
 
+    @property
+    def candidates(self) -> int:
+        return mask_of(self.hopeful)
+
 
 def test_naked_pairs_basic_elimination():
     """Test basic naked pair: two cells with same 2 values eliminate those values from others"""
@@ -3,6 +3,7 @@ from typing import NamedTuple
 import pytest
 
 from sudoku.action import Action
+from sudoku.candidates import mask_of
 from sudoku.cell import Cell
 from sudoku.field import Field
 from sudoku.solver.show_possibles import show_possibles
@@ -19,6 +20,10 @@ class MockCell(NamedTuple):
     def __hash__(self) -> int:
         return self.position.as_int()
 
+    @property
+    def candidates(self) -> int:
+        return mask_of(self.hopeful)
+
 
 def test_show_possibles_basic_elimination():
     """Test basic elimination: cell with value 5 eliminates 5 from other cells' hopeful sets"""
@@ -4,6 +4,7 @@ from typing import NamedTuple
 import pytest
 
 from sudoku.action import Action
+from sudoku.candidates import mask_of
 from sudoku.cell import Cell
 from sudoku.field import Field
 from sudoku.solver.singles import singles
@@ -20,6 +21,10 @@ class MockCell(NamedTuple):
     def __hash__(self) -> int:
         return self.position.as_int()
 
+    @property
+    def candidates(self) -> int:
+        return mask_of(self.hopeful)
+
 
 def test_singles_single_possibility_for_number():
     """Test that a number with only one possible cell generates a set_number action"""
@@ -215,7 +220,7 @@ def test_singles_reason_format():
 
     # Verify the reason format
     expected_reason = f"single 7 found in column at {cell_pos}"
-    assert action.reason == expected_reason
+    assert str(action.reason) == expected_reason
 
 
 def test_singles_comprehensive_scenario():
@@ -3,6 +3,7 @@ from typing import NamedTuple
 import pytest
 
 from sudoku.action import Action
+from sudoku.candidates import mask_of
 from sudoku.cell import Cell
 from sudoku.field import Field
 from sudoku.solver.solved import solved
@@ -19,6 +20,10 @@ class MockCell(NamedTuple):
     def __hash__(self) -> int:
         return self.position.as_int()
 
+    @property
+    def candidates(self) -> int:
+        return mask_of(self.hopeful)
+
 
 def test_solved_single_cell_with_one_hopeful():
     """Test that a cell with exactly one hopeful value generates a set_number action"""
@@ -201,4 +206,4 @@ def test_solved_reason_format():
 
     # Verify the reason format
     expected_reason = f"solved cell 6 found at {cell_pos}"
-    assert action.reason == expected_reason
+    assert str(action.reason) == expected_reason
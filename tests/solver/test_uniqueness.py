@@ -0,0 +1,33 @@
+from sudoku.engine import solve
+from sudoku.field import Field
+from sudoku.solver.uniqueness import Uniqueness, count_solutions, uniqueness
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_unique() -> None:
+    field = Field(HARD)
+    assert field.count_solutions() == 1
+    assert uniqueness(field) == Uniqueness.UNIQUE
+
+
+def test_multiple_solutions() -> None:
+    # without the first value the puzzle has many solutions
+    field = Field("0" + HARD[1:])
+    assert field.count_solutions() == 2
+    assert count_solutions(field, limit=5) == 5
+    assert uniqueness(field) == Uniqueness.MULTIPLE_SOLUTIONS
+
+
+def test_no_solution() -> None:
+    field = Field("88" + HARD[2:])
+    assert field.count_solutions() == 0
+    assert uniqueness(field) == Uniqueness.NO_SOLUTION
+
+
+def test_after_logical_solvers() -> None:
+    field = Field(HARD)
+    solve(field)
+    assert field.count_solutions(limit=None) == 1
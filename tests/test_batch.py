@@ -0,0 +1,41 @@
+import pytest
+
+from sudoku.batch import solve_many, solve_puzzle
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_solve_puzzle() -> None:
+    result = solve_puzzle(EASY.replace("0", "."))
+    assert result.status == "solved"
+    assert "0" not in result.solution
+    assert solve_puzzle("123").status == "invalid"
+
+
+def test_solve_many_keeps_order() -> None:
+    puzzles = [EASY, HARD, "123"] * 3
+    for workers in (1, 2):
+        results = list(solve_many(puzzles, workers=workers, chunksize=2))
+        assert [result.status for result in results] == [
+            "solved",
+            "stuck",
+            "invalid",
+        ] * 3
+
+
+def test_solve_many_vectorized() -> None:
+    pytest.importorskip("numpy")
+    puzzles = [EASY, HARD, "123"] * 3
+    results = list(solve_many(puzzles, workers=1, chunksize=4, vectorized=True))
+    assert [result.status for result in results] == ["solved", "stuck", "invalid"] * 3
+
+
+def test_solve_many_rejects_empty_pools() -> None:
+    for options in (dict(workers=0), dict(chunksize=0), dict(chunksize=-1)):
+        with pytest.raises(ValueError):
+            solve_many(["0" * 81], **options)
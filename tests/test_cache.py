@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from sudoku.cache import ResultCache, compute, normalize
+from sudoku.canonical import Transform
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+TRANSFORM = Transform(
+    transpose=True,
+    rows=(5, 3, 4, 8, 6, 7, 1, 0, 2),
+    columns=(6, 8, 7, 0, 1, 2, 4, 3, 5),
+    digits=(0, 3, 1, 4, 9, 2, 7, 5, 6, 8),
+)
+
+
+def test_memory() -> None:
+    cache = ResultCache(maxsize=1)
+    result = cache.get(EASY)
+    assert result == compute(EASY)
+    assert result.status == "solved"
+    assert cache.get(EASY.replace("0", ".")) is result
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.get(TRANSFORM.apply(EASY))
+    assert len(cache) == 1
+    cache.get(EASY)
+    assert cache.misses == 3
+
+
+def test_sqlite(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    with ResultCache(path=path) as cache:
+        expected = cache.get(EASY)
+    with ResultCache(path=path) as cache:
+        assert cache.get(EASY) == expected
+        assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_canonical() -> None:
+    cache = ResultCache(canonical=True)
+    transformed = TRANSFORM.apply(EASY)
+    assert cache.get(EASY).solution == compute(EASY).solution
+    assert cache.get(transformed).solution == TRANSFORM.apply(compute(EASY).solution)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_normalize() -> None:
+    assert normalize("1.2") == "102" + "0" * 78
+
+
+def test_other_versions(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    with ResultCache(path=path) as cache:
+        cache.get(EASY)
+    with ResultCache(path=path) as cache:
+        cache._version = "other"
+        cache.get(EASY)
+        assert cache.misses == 1
+    with ResultCache(path=path) as cache:
+        cache.get(EASY)
+        assert cache.hits == 1
+        assert cache.prune() == 1
+        assert cache.prune() == 0
+
+
+def test_stuck() -> None:
+    result = compute(HARD)
+    assert result.status == "stuck"
+    assert result.hardest is not None
+    assert "0" not in result.solution
+    assert all(value in ("0", solved) for value, solved in zip(HARD, result.solution))
+    # the techniques get stuck on this one too, but it has no solution
+    assert compute("82" + HARD[2:]).status == "contradiction"
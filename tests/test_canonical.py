@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from sudoku.canonical import Transform, canonical_key, canonicalize, dedup
+from sudoku.field import Field
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+
+TRANSFORM = Transform(
+    transpose=True,
+    rows=(5, 3, 4, 8, 6, 7, 1, 0, 2),
+    columns=(6, 8, 7, 0, 1, 2, 4, 3, 5),
+    digits=(0, 3, 1, 4, 9, 2, 7, 5, 6, 8),
+)
+
+
+def test_transform() -> None:
+    transformed = TRANSFORM.apply(HARD)
+    assert transformed != HARD
+    assert TRANSFORM.invert().apply(transformed) == HARD
+    assert Field(transformed).count_solutions() == 1
+
+
+def test_canonicalize() -> None:
+    canonical = canonicalize(HARD)
+    assert canonical.transform.apply(HARD) == canonical.puzzle
+    assert canonical.transform.invert().apply(canonical.puzzle) == HARD
+    assert canonical_key(TRANSFORM.apply(HARD)) == canonical.puzzle
+    assert canonical_key(Field(HARD)) == canonical.puzzle
+    assert canonical_key(EASY) != canonical.puzzle
+
+
+def test_dedup() -> None:
+    puzzles = [HARD, TRANSFORM.apply(HARD), EASY, TRANSFORM.apply(EASY), HARD]
+    for workers in (1, 2):
+        assert [puzzle for puzzle, _ in dedup(puzzles, workers, chunksize=2)] == [
+            HARD,
+            EASY,
+        ]
+
+
+def test_canonicalize_degenerate() -> None:
+    row = "123456789" + "0" * 72
+    for puzzle in ("0" * 81, row, "0" * 40 + "5" + "0" * 40):
+        start = time.perf_counter()
+        canonical = canonicalize(puzzle)
+        assert time.perf_counter() - start < 1
+        assert canonical.transform.apply(puzzle) == canonical.puzzle
+        assert canonical_key(TRANSFORM.apply(puzzle)) == canonical.puzzle
+    assert canonical_key(row) == "".join(
+        "00000000" + str(digit) for digit in range(1, 10)
+    )
+
+
+def test_canonicalize_dots() -> None:
+    dots = [HARD.replace("0", "."), EASY.replace("0", ".")]
+    assert canonical_key(dots[0]) == canonical_key(HARD)
+    assert [puzzle for puzzle, _ in dedup(dots, 1)] == dots
+    for puzzle in (HARD[:80], HARD + "0", HARD[:80] + "x"):
+        with pytest.raises(ValueError):
+            canonicalize(puzzle)
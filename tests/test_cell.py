@@ -1,7 +1,23 @@
 from sudoku.cell import Cell
+from sudoku.grid import Grid
 from sudoku.types import CellPosition
 
 
 def test_cell() -> None:
     c = Cell(0, CellPosition(0, 0))
     del c
+
+
+def test_cell_view() -> None:
+    grid = Grid([0, 5])
+    c = Cell.view(grid, 1)
+    assert c.value == 5
+    assert c.candidates == 0
+
+    c = Cell.view(grid, 0)
+    c.hopeful = {1, 2}
+    assert grid.candidates[0] == 0b11
+    assert c.futile == {3, 4, 5, 6, 7, 8, 9}
+    c.value = 2
+    assert grid.values[0] == 2
+    assert not c.hopeful
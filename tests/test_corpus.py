@@ -0,0 +1,62 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from sudoku import savegame
+from sudoku.corpus import Corpus, index_path
+from sudoku.field import Field
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_text(tmp_path: Path) -> None:
+    path = tmp_path / "puzzles.txt"
+    path.write_text(f"# comment\n{EASY}\n\n{HARD.replace('0', '.')}\tstuck\n{EASY}")
+    with Corpus(path) as corpus:
+        assert len(corpus) == 3
+        assert corpus.raw(1) == HARD.replace("0", ".").encode()
+        assert corpus[1].grid == Field(HARD).grid
+        assert [field.grid for field in corpus[::2]] == [Field(EASY).grid] * 2
+        assert corpus[-1].grid == Field(EASY).grid
+        with pytest.raises(IndexError):
+            corpus.raw(3)
+    assert index_path(path).exists()
+    with Corpus(path) as corpus:
+        assert corpus.ranges(2) == [range(0, 1), range(1, 3)]
+
+
+def test_outdated_index(tmp_path: Path) -> None:
+    path = tmp_path / "puzzles.txt"
+    path.write_text(EASY)
+    with Corpus(path) as corpus:
+        assert len(corpus) == 1
+    path.write_text(f"{EASY}\n{HARD}\n")
+    with Corpus(path) as corpus:
+        assert len(corpus) == 2
+
+
+def test_container(tmp_path: Path) -> None:
+    path = tmp_path / "boards.sdkc"
+    fields = [Field(EASY), Field(HARD)]
+    fields[1].solve()
+    savegame.dump_container(path, (field.grid for field in fields))
+    with Corpus(path) as corpus:
+        assert len(corpus) == 2
+        assert [field.grid for field in corpus[:]] == [field.grid for field in fields]
+        assert len(corpus.raw(0)) == savegame.BOARD.size
+    assert not index_path(path).exists()
+
+
+def test_pickle(tmp_path: Path) -> None:
+    path = tmp_path / "puzzles.txt"
+    path.write_text(f"{EASY}\n{HARD}\n")
+    with Corpus(path) as corpus:
+        copy = pickle.loads(pickle.dumps(corpus))
+        assert copy[1].grid == corpus[1].grid
+        copy.close()
@@ -0,0 +1,112 @@
+from random import Random
+
+from sudoku import engine
+from sudoku.engine import SolveStatus
+from sudoku.field import Field
+from sudoku.solver import SolverStats, show_possibles
+from sudoku.units import UNITS
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_solve() -> None:
+    field = Field(EASY)
+    result = field.solve()
+    assert result.status == SolveStatus.SOLVED
+    assert result.steps > 0
+    assert engine.is_solved(field)
+    for unit in UNITS:
+        assert sorted(field.grid.values[index] for index in unit) == list(range(1, 10))
+
+
+def test_solve_stuck() -> None:
+    field = Field(HARD)
+    result = engine.solve(field)
+    assert result.status == SolveStatus.STUCK
+    assert not engine.is_contradiction(field)
+
+
+def test_solve_contradiction() -> None:
+    field = Field("11" + EASY[2:])
+    assert engine.solve(field).status == SolveStatus.CONTRADICTION
+
+
+def test_step() -> None:
+    field = Field(EASY)
+    step = engine.step(field)
+    assert step is not None
+    assert step.solver == "show_possibles"
+    assert all(action.action == "remove_possible" for action in step.actions)
+
+
+def test_solve_stats() -> None:
+    stats = SolverStats()
+    result = engine.solve(Field(EASY), stats=stats)
+    assert result.stats is stats
+    assert sum(unit.changed for unit in stats.units.values()) == result.changes
+    per_solver = stats.per_solver()
+    assert per_solver["show_possibles"].groups > 0
+    assert per_solver["show_possibles"].yielded >= per_solver["show_possibles"].changed
+    assert set(type for _, type in stats.units) <= {"row", "column", "block"} | {
+        "rows",
+        "columns",
+        "digit",
+    }
+    assert engine.solve(Field(EASY)).stats is None
+
+
+def test_since_skips_unchanged_units() -> None:
+    field = Field(EASY)
+    generation = field.grid.generation
+    stats = SolverStats()
+    assert list(show_possibles(field, since=generation, stats=stats)) == []
+    assert stats.per_solver() == {}
+
+    field.get_cell(0, 0).hopeful = {4, 5}
+    stats = SolverStats()
+    list(show_possibles(field, since=generation, stats=stats))
+    assert stats.per_solver()["show_possibles"].groups == 3
+
+
+def test_solve_fallback() -> None:
+    field = Field(HARD)
+    result = engine.solve(field, fallback=True)
+    assert result.status == SolveStatus.SOLVED
+    assert result.fallback
+    assert engine.is_solved(field)
+
+
+def test_solve_fallback_not_needed() -> None:
+    result = Field(EASY).solve(fallback=True)
+    assert result.status == SolveStatus.SOLVED
+    assert not result.fallback
+
+
+def test_solve_deterministic() -> None:
+    def trace(rng: Random | None = None) -> list[tuple[str, list[str]]]:
+        steps: list[tuple[str, list[str]]] = []
+        engine.solve(
+            Field(EASY),
+            on_step=lambda step: steps.append(
+                (step.solver, [str(action.reason) for action in step.actions])
+            ),
+            rng=rng,
+        )
+        return steps
+
+    assert trace() == trace()
+    assert trace(Random(7)) == trace(Random(7))
+    assert trace(Random(7)) != trace()
+
+
+def test_solvers_keep_their_order() -> None:
+    field = Field(EASY)
+    reasons = [str(action.reason) for action in show_possibles(field)]
+    list(show_possibles(field, rng=Random(1)))
+    assert [str(action.reason) for action in show_possibles(field)] == reasons
+    assert "in the same row at CellPosition(x=2, y=0)" in reasons[0]
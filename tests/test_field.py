@@ -3,7 +3,10 @@ from typing import List, NamedTuple
 
 import pytest
 
+from sudoku.action import Action
+from sudoku.candidates import ALL_CANDIDATES
 from sudoku.field import Field
+from sudoku.grid import Grid
 
 
 class DCell(NamedTuple):
@@ -22,5 +25,136 @@ def test_field() -> None:
     assert len(f.cells) == 81
 
 
+def test_field_grid() -> None:
+    f = Field(
+        "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
+    )
+    assert f.get_cell(0, 0).value == 1
+    assert f.get_cell(1, 0).candidates == ALL_CANDIDATES
+    assert len(Field("").cells) == 81
+
+    copy = f.grid.copy()
+    f.set_cell(1, 0, 2)
+    assert copy != f.grid
+    assert copy.values[1] == 0
+    assert Grid.frombytes(bytes(f)) == f.grid
+
+
+def test_field_place() -> None:
+    f = Field("")
+    f.set_cell(4, 4, 5)
+    cell = f.get_cell(4, 4)
+    assert cell.value == 5
+    for other in f.cells:
+        if other is cell:
+            continue
+        assert (5 in other.hopeful) != cell.sees(other)
+    assert len(f.grid.log) == 20
+    assert f.get_cell(4, 0)._debug == [(5, "value 5 is set at CellPosition(x=4, y=4)")]
+
+    f = Field("", record_reasons=False)
+    f.set_cell(0, 0, 1)
+    assert 1 not in f.get_cell(8, 0).hopeful
+    assert not f.grid.log
+
+
+def test_field_constructors() -> None:
+    puzzle = "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
+    expected = Field(puzzle).grid
+    assert Field(" ".join(puzzle) + "x").grid == expected
+    assert Field.from_string(puzzle).grid == expected
+    assert Field.from_string(puzzle.replace("0", ".").encode()).grid == expected
+    assert Field.from_masks(expected.values, expected.candidates).grid == expected
+    assert Field.from_buffer(bytes(Field(puzzle))).grid == expected
+    with pytest.raises(ValueError):
+        Field.from_string(puzzle[1:])
+    with pytest.raises(ValueError):
+        Field.from_string(puzzle[1:] + "x")
+    with pytest.raises(ValueError):
+        Field("1" * 82)
+
+
+def test_field_reset() -> None:
+    puzzle = "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
+    f = Field("")
+    cell = f.get_cell(0, 0)
+    f.set_cell(1, 1, 3)
+    f.reset(puzzle)
+    assert f.grid == Field(puzzle).grid
+    assert not f.grid.log
+    assert cell.value == 1
+    assert f.get_cell(0, 0) is cell
+
+
+def test_field_snapshot() -> None:
+    f = Field(
+        "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
+    )
+    expected = f.grid.copy()
+    snapshot = f.snapshot()
+    cell = f.get_cell(1, 0)
+    f.set_cell(1, 0, 2)
+    assert f.grid != expected
+    f.restore(snapshot)
+    assert f.grid == expected
+    assert not f.grid.log
+    assert cell.value == 0
+    assert f.grid.unit_generations[0] == f.grid.generation
+
+    f.set_cell(1, 0, 2)
+    f.restore(snapshot)
+    assert f.grid == expected
+
+
+def test_field_copy() -> None:
+    f = Field("")
+    f.set_cell(0, 0, 1)
+    copy = f.copy()
+    assert copy.grid == f.grid
+    assert copy.grid.log == f.grid.log
+    # reading doesn't copy the shared log
+    assert copy.grid.log is f.grid.log
+    copy.set_cell(1, 1, 2)
+    f.set_cell(8, 8, 3)
+    assert f.get_cell(1, 1).value == 0
+    assert copy.get_cell(8, 8).value == 0
+    assert len(f.grid.log) == 40
+    assert len(copy.grid.log) == 39
+    assert f.grid.log[:20] == copy.grid.log[:20]
+    assert f.grid.log[20:] != copy.grid.log[20:]
+
+
+def test_field_apply_many() -> None:
+    f = Field("")
+    a, b, c = f.get_cell(0, 0), f.get_cell(1, 0), f.get_cell(2, 2)
+    summary = f.apply_many(
+        [
+            Action("remove_possible", 1, b, "test"),
+            Action("remove_possible", 2, b, "test"),
+            Action("remove_possible", 1, b, "test"),
+            Action("set_number", 1, a, "test"),
+            Action("set_number", 1, a, "test"),
+            Action("remove_possible", 1, c, "eliminations come first"),
+        ]
+    )
+    assert summary.changed == [True, True, False, True, False, True]
+    assert summary.placed == 1
+    assert summary.removed == 3
+    assert a.value == 1
+    assert b.hopeful == {3, 4, 5, 6, 7, 8, 9}
+    assert not f.apply_many([Action("set_number", 1, a, "test")]).changed[0]
+
+    expected = f.grid.copy()
+    for conflict in (
+        [Action("set_number", 3, b, "test"), Action("set_number", 3, c, "test")],
+        [Action("set_number", 3, b, "test"), Action("set_number", 4, b, "test")],
+        [Action("remove_possible", 3, b, "test"), Action("set_number", 3, b, "test")],
+        [Action("set_number", 2, b, "test")],
+    ):
+        with pytest.raises(AssertionError):
+            f.apply_many(conflict)
+        assert f.grid == expected
+
+
 if __name__ == "__main__":
     pytest.main(["-k", "field"])
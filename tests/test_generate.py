@@ -0,0 +1,60 @@
+import pytest
+
+from sudoku.field import Field
+from sudoku.generate import (
+    WEIGHTS,
+    Symmetry,
+    generate,
+    generate_many,
+    hardest_technique,
+)
+
+
+def test_generate() -> None:
+    puzzle = generate(seed=1)
+    assert puzzle == generate(seed=1)
+    assert Field(puzzle.puzzle).count_solutions() == 1
+    assert puzzle.clues == sum(1 for value in puzzle.puzzle if value != "0")
+    assert all(
+        value in ("0", solved) for value, solved in zip(puzzle.puzzle, puzzle.solution)
+    )
+    assert puzzle.hardest == hardest_technique(puzzle.puzzle)
+
+
+def test_symmetry() -> None:
+    puzzle = generate(seed=2, symmetry=Symmetry.ROTATIONAL).puzzle
+    assert [value == "0" for value in puzzle] == [
+        value == "0" for value in reversed(puzzle)
+    ]
+
+
+def test_difficulty_band() -> None:
+    puzzle = generate(seed=3, easiest="naked_pairs", hardest="hidden_pairs")
+    assert puzzle.hardest is not None
+    assert WEIGHTS["naked_pairs"] <= WEIGHTS[puzzle.hardest] <= WEIGHTS["hidden_pairs"]
+
+
+def test_clue_count() -> None:
+    puzzle = generate(seed=4, min_clues=40, max_clues=41)
+    assert 40 <= puzzle.clues <= 41
+
+
+def test_generate_many() -> None:
+    assert list(generate_many(3, seed=5, workers=1)) == list(
+        generate_many(3, seed=5, workers=2)
+    )
+
+
+def test_impossible_options() -> None:
+    for options in (
+        dict(easiest="x_wing", hardest="singles"),
+        dict(hardest="unknown"),
+        dict(min_clues=30, max_clues=25),
+        dict(max_clues=16),
+    ):
+        with pytest.raises(ValueError):
+            generate(seed=6, **options)
+        with pytest.raises(ValueError):
+            next(generate_many(1, seed=6, workers=1, **options))
+    with pytest.raises(RuntimeError):
+        generate(seed=6, max_clues=17, max_attempts=2)
@@ -0,0 +1,37 @@
+from sudoku.engine import SolveStatus
+from sudoku.field import Field
+from sudoku.grade import WEIGHTS, grade
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_grade() -> None:
+    result = grade(Field(EASY))
+    assert result.solved
+    assert result.hardest in result.steps
+    assert all(WEIGHTS[name] <= WEIGHTS[result.hardest] for name in result.steps)
+    assert result.score == sum(
+        WEIGHTS[name] * count for name, count in result.steps.items()
+    )
+
+
+def test_grade_stuck() -> None:
+    result = grade(Field(HARD, record_reasons=False))
+    assert result.status == SolveStatus.STUCK
+    assert not result.solved
+    assert grade(Field(HARD)).score == result.score
+
+
+def test_grade_solved_field() -> None:
+    field = Field(EASY)
+    field.solve()
+    result = grade(field)
+    assert result.solved
+    assert result.hardest is None
+    assert result.steps == {}
+    assert result.score == 0
@@ -0,0 +1,64 @@
+from sudoku.engine import step
+from sudoku.field import Field
+from sudoku.journal import Journal
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+
+
+def test_journal_rollback() -> None:
+    f = Field(EASY)
+    journal = Journal(f)
+    expected = f.grid.copy()
+    mark = journal.mark()
+    f.set_cell(0, 0, 4)
+    inner = journal.mark()
+    f.set_cell(1, 0, 8)
+    assert len(journal.trail) > 2
+    journal.rollback(inner)
+    assert f.get_cell(1, 0).value == 0
+    assert f.get_cell(0, 0).value == 4
+    assert journal.marks == [mark]
+    journal.rollback(mark)
+    assert f.grid == expected
+    assert f.grid.log == expected.log
+    assert not journal.trail
+    assert not journal.marks
+
+
+def test_journal_undo_redo() -> None:
+    f = Field(EASY)
+    journal = Journal(f)
+    states = [f.grid.copy()]
+    for _ in range(3):
+        journal.mark()
+        assert step(f) is not None
+        states.append(f.grid.copy())
+    for state in reversed(states[:-1]):
+        assert journal.undo()
+        assert f.grid == state
+        assert f.grid.log == state.log
+    assert not journal.undo()
+    for state in states[1:]:
+        assert journal.redo()
+        assert f.grid == state
+        assert f.grid.log == state.log
+    assert not journal.redo()
+
+    journal.undo()
+    journal.mark()
+    assert not journal.redo()
+
+
+def test_journal_detach() -> None:
+    f = Field(EASY)
+    journal = Journal(f)
+    f.set_cell(0, 0, 4)
+    size = len(journal.trail)
+    assert size
+    journal.detach()
+    assert f.journal is None
+    f.set_cell(1, 0, 8)
+    assert len(journal.trail) == size
+    assert f.copy().journal is None
@@ -0,0 +1,52 @@
+from sudoku.field import Field
+from sudoku.reason import Reason, Technique
+from sudoku.solver import naked_pairs
+
+
+def test_reason_text() -> None:
+    reason = Reason(Technique.SINGLE, "column", (10,), (7,))
+    text = "single 7 found in column at CellPosition(x=1, y=1)"
+    assert str(reason) == text
+    assert reason != text
+    assert reason not in {text}
+    assert "found in column" in reason
+    assert hash(reason) == hash(Reason(Technique.SINGLE, "column", (10,), (7,)))
+    assert reason == Reason(Technique.SINGLE, "column", (10,), (7,))
+    assert reason != Reason(Technique.SINGLE, "row", (10,), (7,))
+    assert str(Reason(Technique.EXACT_COVER)) == "set by exact cover search"
+    assert (
+        str(Reason(Technique.NAKED_PAIR, "row", (0, 1), (2, 3)))
+        == "naked pair in same row (2, 3) on "
+        "[CellPosition(x=0, y=0), CellPosition(x=1, y=0)]"
+    )
+
+
+def test_reason_shared() -> None:
+    f = Field("")
+    f.get_cell(0, 0).hopeful = {2, 3}
+    f.get_cell(1, 0).hopeful = {2, 3}
+    group = f.get_group("row", 0)
+    actions = list(naked_pairs(f, type="row", idx=0, group=group))
+    assert len(actions) == 14
+    # all eliminations of one pair share a single reason
+    assert len({id(action.reason) for action in actions}) == 1
+
+
+def test_reason_log() -> None:
+    f = Field("")
+    f.set_cell(0, 0, 1)
+    assert isinstance(f.grid.log[0][2], Reason)
+    assert f.get_cell(1, 0)._debug == [(1, "value 1 is set at CellPosition(x=0, y=0)")]
+    f = Field("", record_reasons=False)
+    f.set_cell(0, 0, 1)
+    assert not f.grid.log
+
+
+def test_reason_skipped() -> None:
+    f = Field("", record_reasons=False)
+    f.get_cell(0, 0).hopeful = {2, 3}
+    f.get_cell(1, 0).hopeful = {2, 3}
+    group = f.get_group("row", 0)
+    actions = list(naked_pairs(f, type="row", idx=0, group=group))
+    assert len(actions) == 14
+    assert all(action.reason is None for action in actions)
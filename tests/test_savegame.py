@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from sudoku import savegame
+from sudoku.field import Field
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+SAVEGAMES = Path(__file__).parent / "savegames"
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    field = Field(HARD)
+    field.solve()
+    path = tmp_path / "board.sdk"
+    field.save(path, binary=True)
+    assert path.stat().st_size == savegame.HEADER.size + savegame.BOARD.size
+
+    loaded = Field("")
+    cell = loaded.cells[0]
+    loaded.load(path)
+    assert loaded.grid == field.grid
+    assert cell.value == 8
+
+
+def test_log() -> None:
+    field = Field(HARD)
+    field.solve()
+    grid = savegame.loads(savegame.dumps(field.grid, log=True))
+    assert grid == field.grid
+    assert grid.log == [(i, v, str(r)) for i, v, r in field.grid.log]
+    assert savegame.loads(savegame.dumps(field.grid)).log == []
+
+
+def test_json_savegames_still_load(tmp_path: Path) -> None:
+    field = Field("")
+    field.set_cell(0, 0, 1)
+    field.load(SAVEGAMES / "xwing.savegame")
+    assert not field.grid.log
+    path = tmp_path / "xwing.sdk"
+    field.save(path, binary=True)
+    loaded = Field("")
+    loaded.load(path)
+    assert loaded.grid == field.grid
+
+
+def test_container(tmp_path: Path) -> None:
+    fields = [Field(HARD), Field(HARD[::-1])]
+    fields[0].solve()
+    path = tmp_path / "boards.sdkc"
+    assert savegame.dump_container(path, (field.grid for field in fields)) == 2
+    assert list(savegame.load_container(path)) == [field.grid for field in fields]
+    buffer = path.read_bytes()
+    assert savegame.container_size(buffer) == 2
+    assert savegame.container_board(buffer, 1) == fields[1].grid
+    for index in (-1, 2):
+        with pytest.raises(IndexError):
+            savegame.container_board(buffer, index)
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError):
+        savegame.loads(b"JSON" + bytes(savegame.BOARD.size))
+    with pytest.raises(ValueError):
+        savegame.loads(savegame.MAGIC + b"\x09" + bytes(savegame.BOARD.size + 3))
@@ -0,0 +1,33 @@
+from sudoku.field import Field
+from sudoku.types import CellPosition
+from sudoku.units import CELL_UNITS, PEERS, UNITS, unit_id
+
+
+def test_unit_tables() -> None:
+    assert len(UNITS) == 27
+    assert all(len(unit) == 9 for unit in UNITS)
+    assert all(len(peers) == 20 for peers in PEERS)
+    for index in range(81):
+        position = CellPosition.from_int(index)
+        assert CELL_UNITS[index] == (
+            unit_id("row", position.row),
+            unit_id("column", position.column),
+            unit_id("block", position.block),
+        )
+
+
+def test_field_groups() -> None:
+    f = Field(
+        "100400006046091080005020000000500109090000050402009000000010900080930560500008004"
+    )
+    for type in ("row", "column", "block"):
+        for idx in range(9):
+            group = f.get_group(type, idx)
+            assert group is f.get_group(type, idx)
+            assert [getattr(cell.position, type) for cell in group] == [idx] * 9
+            assert list(group) == sorted(group)
+
+    cell = f.get_cell(4, 4)
+    assert len(f.peers(cell)) == 20
+    assert all(cell.sees(peer) for peer in f.peers(cell))
+    assert cell not in f.peers(cell)
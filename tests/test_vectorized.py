@@ -0,0 +1,46 @@
+import pytest
+
+from sudoku import engine
+from sudoku.engine import SolveStatus
+from sudoku.field import Field
+
+vectorized = pytest.importorskip("sudoku.vectorized")
+
+EASY = (
+    "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+def test_solve() -> None:
+    puzzles = [EASY, HARD, "11" + EASY[2:], EASY]
+    results = vectorized.solve(puzzles)
+    for puzzle, result in zip(puzzles, results):
+        field = Field(puzzle)
+        expected = engine.solve(field)
+        assert result.status == expected.status
+        assert result.solution == "".join(map(str, field.grid.values))
+    assert [result.vectorized for result in results] == [True, False, True, True]
+
+
+def test_solve_fallback() -> None:
+    (result,) = vectorized.solve([HARD], fallback=True)
+    assert result.status == SolveStatus.SOLVED
+    assert not result.vectorized
+
+
+def test_fields_are_not_changed() -> None:
+    field = Field(EASY)
+    vectorized.solve([field])
+    assert bytes(field) == bytes(Field(EASY))
+
+
+def test_arrays() -> None:
+    field = Field(HARD)
+    field.solve()
+    values, candidates = vectorized.to_arrays([field])
+    assert values.shape == (1, 81)
+    assert candidates.shape == (1, 81, 9)
+    assert vectorized.to_field(values[0], candidates[0]).grid == field.grid